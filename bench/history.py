@@ -0,0 +1,79 @@
+import datetime,json,os,random,shutil,sqlite3,sys,tempfile,time
+
+SCHEMA='''
+CREATE TABLE history (runtime DATETIME PRIMARY KEY NOT NULL, name NVARCHAR NOT NULL, command NVARCHAR NOT NULL);
+CREATE TABLE reports (tool NVARCHAR NOT NULL, filename NVARCHAR NOT NULL, sendtime DATETIME NOT NULL, UNIQUE (tool, filename));
+'''
+MIGRATION='''
+CREATE INDEX IF NOT EXISTS history_name_runtime ON history (name,runtime);
+CREATE INDEX IF NOT EXISTS reports_tool_sendtime ON reports (tool,sendtime,filename);
+CREATE TABLE usages (name NVARCHAR PRIMARY KEY NOT NULL,count INTEGER NOT NULL,runtime DATETIME NOT NULL);
+CREATE INDEX usages_count_runtime ON usages (count DESC,runtime DESC);
+CREATE INDEX usages_runtime ON usages (runtime DESC);
+INSERT INTO usages SELECT name,COUNT(name),MAX(runtime) FROM history GROUP BY name;
+CREATE TRIGGER history_insert AFTER INSERT ON history BEGIN
+    INSERT INTO usages VALUES (NEW.name,1,NEW.runtime) ON CONFLICT (name) DO UPDATE SET count=count+1,runtime=MAX(runtime,excluded.runtime);
+END;
+'''
+
+def Build(filename:str,rows:int,tools:int,reports:int)->None:
+    r=random.Random(0)
+    n=[f'tool{i:04d}' for i in range(tools)]
+    t=datetime.datetime(2020,1,1)
+    with sqlite3.connect(filename) as c:
+        c.executescript(SCHEMA)
+        c.executemany('INSERT INTO history VALUES (?,?,?)',((str(t+datetime.timedelta(seconds=i,microseconds=r.randrange(1000000))),n[int(r.paretovariate(1.2))%tools],'cmd /k') for i in range(rows)))
+        c.executemany('INSERT INTO reports VALUES (?,?,?)',((n[i%tools],f'output/{i}.txt',str(t+datetime.timedelta(seconds=r.randrange(rows)))) for i in range(reports)))
+    c.close()
+
+def Measure(title:str,count:int,method:...)->float:
+    t=time.perf_counter()
+    method()
+    t=(time.perf_counter()-t)*1000
+    print(f'  {title:<52}{t:>10.1f} ms{f'{t/count:>10.3f} ms/op' if count>1 else ''}')
+    return t
+
+def main()->None:
+    rows=int(sys.argv[1]) if len(sys.argv)>1 else 1000000
+    tools,reports,inserts,shown=300,50000,500,99
+    d=tempfile.mkdtemp()
+    try:
+        a,b=os.path.join(d,'before.db'),os.path.join(d,'after.db')
+        print(f'Building {rows} history rows and {reports} reports over {tools} tools')
+        Build(a,rows,tools,reports)
+        shutil.copy(a,b)
+        c=sqlite3.connect(b)
+        c.execute('PRAGMA journal_mode=WAL')
+        c.execute('PRAGMA synchronous=NORMAL')
+        Measure('migration (indexes, usages table, trigger)',1,lambda:c.executescript(f'BEGIN;{MIGRATION}COMMIT;'))
+        names=[f'tool{i:04d}' for i in random.Random(1).sample(range(tools),50)]
+        def Runtime(i:int)->str:
+            return str(datetime.datetime(2030,1,1)+datetime.timedelta(seconds=i))
+        def Before()->None:
+            for i in range(inserts):
+                with sqlite3.connect(a) as e:e.execute('INSERT INTO history VALUES (?,?,?)',(Runtime(i),names[i%50],'cmd /k'))
+                e.close()
+        def After()->None:
+            for i in range(inserts):
+                c.execute('INSERT INTO history VALUES (?,?,?)',(Runtime(i),names[i%50],'cmd /k'))
+                c.commit()
+        def Batch()->None:
+            with c:c.executemany('INSERT INTO history VALUES (?,?,?)',[(Runtime(inserts+i),names[i%50],'cmd /k') for i in range(inserts)])
+        print('Inserts')
+        Measure('before: connect and commit per row, rollback journal',inserts,Before)
+        Measure('after: pooled WAL connection, commit per row',inserts,After)
+        Measure('after: pooled WAL connection, one batch',inserts,Batch)
+        print('Usage counts (history panel)')
+        e=sqlite3.connect(a)
+        Measure('before: GROUP BY over history',1,lambda:e.execute('SELECT name,COUNT(name) c,MAX(runtime) t FROM history GROUP BY name ORDER BY c DESC,t DESC').fetchall()[:shown])
+        Measure('after: usages table',1,lambda:c.execute('SELECT name,count c,runtime t FROM usages ORDER BY c DESC,t DESC LIMIT ?',(shown,)).fetchall())
+        print(f'Report reads ({len(names)} history frames)')
+        Measure('before: full scan per tool, sliced in Python',len(names),lambda:[e.execute('SELECT filename FROM reports WHERE tool=? ORDER BY sendtime',(i,)).fetchall()[:-10:-1] for i in names])
+        Measure('after: indexed LIMIT 10 per tool',len(names),lambda:[c.execute('SELECT filename FROM reports WHERE tool=? ORDER BY sendtime DESC LIMIT 10',(i,)).fetchall() for i in names])
+        Measure('after: one query, LIMIT 10 per tool',1,lambda:c.execute('SELECT r.tool,r.filename FROM json_each(?) t JOIN reports r ON r.rowid IN (SELECT rowid FROM reports WHERE tool=t.value ORDER BY sendtime DESC LIMIT 10) ORDER BY r.tool,r.sendtime DESC',(json.dumps(names),)).fetchall())
+        e.close()
+        c.close()
+    finally:shutil.rmtree(d,ignore_errors=True)
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,40 @@
+import os,sys,time
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from preview import PreviewPipeline
+
+class Frame:
+
+    def __init__(self,width:int,height:int,bits:bytes)->None:
+        self.bits=bits
+        self.size=width,height
+
+    def constBits(self)->bytes:
+        return self.bits
+
+    def height(self)->int:
+        return self.size[1]
+
+    def width(self)->int:
+        return self.size[0]
+
+def Measure(title:str,pipeline:PreviewPipeline,frames:list[Frame],width:int)->None:
+    t=time.perf_counter()
+    for i in frames:pipeline.Process(i,width)
+    print(f'{title:<40}{(time.perf_counter()-t)*1000/len(frames):>10.3f} ms/frame')
+
+def main()->None:
+    n=int(sys.argv[1]) if len(sys.argv)>1 else 200
+    for w,h,t in [(300,170,300),(600,340,600),(1920,1080,300)]:
+        b=os.urandom(w*h*4)
+        c=[Frame(w,h,b[:-4]+i.to_bytes(4,'little')) for i in range(n)]
+        print(f'{w}x{h} source, {t} px preview')
+        Measure('  unchanged frame (hash and skip)',PreviewPipeline(lambda i,a,b:None),[Frame(w,h,b)]*n,t)
+        Measure('  changed frame (hash, no render)',PreviewPipeline(lambda i,a,b:None),c,t)
+        try:from PySide6.QtGui import QImage,QPixmap
+        except ImportError:continue
+        q=[QImage(i.bits,w,h,QImage.Format.Format_RGB32) for i in c[:max(n//10,1)]]
+        Measure('  changed frame (hash, scale, pixmap)',PreviewPipeline(lambda i,a,b:QPixmap.fromImage(i.scaled(a,b) if (a,b)!=(w,h) else i)),q,t)
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,83 @@
+import os,random,sys,time
+
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from processtree import ProcessNode,ProcessTree
+
+class Process:
+
+    def __init__(self,pid:int,ppid:int)->None:
+        self.info={'create_time':1.0,'name':f'p{pid}.exe','ppid':ppid,'status':'running'}
+        self.pid=pid
+
+class Snapshot:
+
+    def __init__(self,processes:list[Process])->None:
+        self.children={}
+        self.details={}
+        self.processes={i.pid:i for i in processes}
+        self.statuses={(i.pid,1.0):'running' for i in processes}
+        for i in processes:self.children.setdefault(i.info['ppid'],[]).append(i)
+
+    def Children(self,pid:int)->list[Process]:
+        return [i for i in self.children.get(pid,[]) if i.pid!=pid]
+
+class Counter:
+
+    def __init__(self)->None:
+        self.events=0
+
+    def Inserted(self)->None:
+        pass
+
+    def Inserting(self,node:ProcessNode,first:int,last:int)->None:
+        self.events+=last-first+1
+
+    def Removed(self)->None:
+        pass
+
+    def Removing(self,node:ProcessNode,first:int,last:int)->None:
+        self.events+=last-first+1
+
+    def Updated(self,node:ProcessNode,row:int)->None:
+        self.events+=1
+
+def Build(nodes:int,roots:int,fanout:int)->list[Process]:
+    r=[Process(i,0) for i in range(1,roots+1)]
+    n=roots+1
+    for i in r:
+        if n>nodes:break
+        for j in range(fanout):
+            if n>nodes:break
+            r.append(Process(n,i.pid))
+            n+=1
+    return r
+
+def Measure(title:str,tree:ProcessTree,listener:Counter,processlist:list,snapshots:list[Snapshot])->None:
+    listener.events=0
+    t=time.perf_counter()
+    for i in snapshots:tree.Merge(processlist,i)
+    t=(time.perf_counter()-t)*1000
+    print(f'  {title:<40}{t/len(snapshots):>10.3f} ms/merge{listener.events/len(snapshots):>10.1f} events/merge')
+
+def main()->None:
+    nodes=int(sys.argv[1]) if len(sys.argv)>1 else 5000
+    ticks,churn,roots=50,5,20
+    p=Build(nodes,roots,8)
+    l=[[f'tool{i}',i] for i in range(1,roots+1)]
+    c=Counter()
+    t=ProcessTree(c)
+    print(f'{len(p)} processes under {roots} consoles')
+    Measure('first load',t,c,l,[Snapshot(p)])
+    Measure('steady state, nothing changed',t,c,l,[Snapshot(p) for i in range(ticks)])
+    r=random.Random(0)
+    e={i.info['ppid'] for i in p}
+    e=[i for i,j in enumerate(p) if j.pid not in e]
+    n=len(p)+1
+    s=[]
+    for i in range(ticks):
+        for j in r.sample(e,churn):p[j]=Process(n:=n+1,p[j].info['ppid'])
+        s.append(Snapshot(list(p)))
+    Measure(f'{churn} inserts and {churn} removals per tick',t,c,l,s)
+
+if __name__=='__main__':
+    main()
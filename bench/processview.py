@@ -0,0 +1,67 @@
+import os,sys,time
+
+os.environ.setdefault('QT_QPA_PLATFORM','offscreen')
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0,os.getcwd())
+import window
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import QTreeView
+
+class Process:
+
+    def __init__(self,pid:int,ppid:int)->None:
+        self.info={'create_time':1.0,'name':f'p{pid}.exe','ppid':ppid,'status':'running'}
+        self.pid=pid
+
+class Snapshot:
+
+    def __init__(self,processes:list[Process])->None:
+        self.children={}
+        self.details={}
+        self.processes={i.pid:i for i in processes}
+        self.statuses={(i.pid,1.0):'running' for i in processes}
+        for i in processes:self.children.setdefault(i.info['ppid'],[]).append(i)
+
+    def Children(self,pid:int)->list[Process]:
+        return [i for i in self.children.get(pid,[]) if i.pid!=pid]
+
+def Build(roots:int,width:int,depth:int)->list[Process]:
+    r=[Process(i,0) for i in range(1,roots+1)]
+    n=roots
+    for i in range(1,roots+1):
+        for j in range(width):r.append(Process(n:=n+1,i))
+    p=1
+    for i in range(depth):
+        r.append(Process(n:=n+1,p))
+        p=n
+    return r
+
+def Index(model:window.ProcessTreeModel,node:window.ProcessNode)->QModelIndex:
+    return QModelIndex() if node is model.tree.root else model.index(node.Row(),0,Index(model,node.parent))
+
+def Measure(title:str,count:int,method:...)->None:
+    t=time.perf_counter()
+    for i in range(count):method(i)
+    t=(time.perf_counter()-t)*1000
+    print(f'  {title:<40}{t:>10.1f} ms{f'{t/count:>10.3f} ms/op' if count>1 else ''}')
+
+def main()->None:
+    roots,width,depth,repeat=int(sys.argv[1]) if len(sys.argv)>1 else 50,100,200,50
+    m=window.ProcessTreeModel()
+    v=QTreeView()
+    v.setModel(m)
+    v.resize(380,690)
+    v.show()
+    window.app.processEvents()
+    p=Build(roots,width,depth)
+    print(f'{len(p)} processes: {roots} consoles of {width} children, one chain {depth} deep')
+    Measure('first merge into the model',1,lambda i:m.RefreshTree([[f'tool{j}',j] for j in range(1,roots+1)],Snapshot(p)))
+    Measure('expand all',1,lambda i:v.expandAll())
+    Measure('viewport repaint',repeat,lambda i:v.viewport().grab())
+    n=m.tree.root.children[0]
+    while n.children:n=n.children[-1]
+    t=[Index(m,i) for i in [n,m.tree.root.children[-1].children[-1],m.tree.root.children[0]]]
+    Measure('scrollTo deep, last and first row, repaint',repeat,lambda i:(v.scrollTo(t[i%3]),v.viewport().grab()))
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,30 @@
+import os,sys,time
+
+os.environ.setdefault('QT_QPA_PLATFORM','offscreen')
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0,os.getcwd())
+import window
+
+def Tools(count:int,kinds:list[str])->list[dict]:
+    return [{'name':f'tool{i:04d}','type':'cmd','kind':kinds[i%len(kinds)],'prefix':'','path':'.','file':f'tool{i:04d}.exe','output':'','format':'','icon':'','note':f'synthetic tool {i}','extra':''} for i in range(count)]
+
+def main()->None:
+    repeat=int(sys.argv[1]) if len(sys.argv)>1 else 5
+    m=window.mainwindow
+    k=[f'kind{i:02d}' for i in range(12)]
+    m.kinds=[[i,1] for i in k]
+    for n in [50,500,5000]:
+        m.programs=Tools(n,k)
+        m.searcher=window.ToolSearcher(m.programs)
+        m.tools={i['name']:i for i in m.programs}
+        t=0.0
+        for i in range(repeat):
+            c=time.perf_counter()
+            p=window.ToolsPanel()
+            t+=time.perf_counter()-c
+            p.close()
+            window.app.processEvents()
+        print(f'  {f'{n} tools':<40}{t*1000/repeat:>10.1f} ms/panel')
+
+if __name__=='__main__':
+    main()
@@ -0,0 +1,132 @@
+import queue,threading,time,typing
+
+class CommandDispatcher(threading.Thread):
+
+    def __init__(self,transport:'KeystrokeTransport',finished:typing.Callable[[int,str],None],sleep:typing.Callable[[float],None]=time.sleep)->None:
+        super().__init__(daemon=True)
+        self.finished=finished
+        self.jobs=queue.Queue()
+        self.lock=threading.Lock()
+        self.number=0
+        self.pacing={}
+        self.pending=[]
+        self.sleep=sleep
+        self.transport=transport
+
+    def Cancel(self,hwnd:int)->None:
+        with self.lock:
+            for i in self.pending:
+                if i['hwnd']==hwnd:i['cancelled']=True
+            self.pacing.pop(hwnd,None)
+
+    def Stop(self)->None:
+        with self.lock:
+            for i in self.pending:i['cancelled']=True
+        self.jobs.put(None)
+        if self.is_alive():self.join()
+
+    def Submit(self,hwnd:int,text:str)->int:
+        with self.lock:
+            self.number+=1
+            j={'cancelled':False,'hwnd':hwnd,'id':self.number,'text':text}
+            self.pending.append(j)
+        self.jobs.put(j)
+        return j['id']
+
+    def run(self)->None:
+        while (j:=self.jobs.get()) is not None:
+            n=0
+            t=j['text']
+            with self.lock:p=None if j['cancelled'] else self.pacing.setdefault(j['hwnd'],[16,10])
+            while n<len(t) and not j['cancelled']:
+                c=self.transport.Send(j['hwnd'],t[n:n+p[0]])
+                if c<min(p[0],len(t)-n):
+                    if not c and p[1]>=500:break
+                    p[0]=max(p[0]//2,1)
+                    p[1]=min(p[1]*2,500)
+                else:
+                    p[0]=min(p[0]*2,256)
+                    p[1]=max(p[1]//2,10)
+                if (n:=n+c)<len(t):self.sleep(p[1]/1000)
+            with self.lock:self.pending.remove(j)
+            self.finished(j['id'],'sent' if n>=len(t) else 'cancelled' if j['cancelled'] else 'failed')
+
+class KeystrokeTransport(typing.Protocol):
+
+    def Send(self,hwnd:int,text:str)->int:
+        '''Deliver text to hwnd one character at a time, in order, and return how many leading characters were delivered.
+
+        A short count means the window stopped accepting input: the dispatcher backs off and offers the rest again later, and gives up once nothing is accepted at the slowest pace. Send must not raise.
+        '''
+        ...
+
+class WindowDiscovery(threading.Thread):
+
+    def __init__(self,provider:'WindowProvider',found:typing.Callable[[int,int,int,int],None],clock:typing.Callable[[],float]=time.monotonic)->None:
+        super().__init__(daemon=True)
+        self.clock=clock
+        self.event=threading.Event()
+        self.found=found
+        self.lock=threading.Lock()
+        self.lookups={}
+        self.number=0
+        self.provider=provider
+        self.stopped=False
+
+    def Cancel(self,lookup:int)->int:
+        with self.lock:l=self.lookups.pop(lookup,None)
+        return l['ppid'] if l else 0
+
+    def Find(self,ppid:int,window:bool=True,timeout:float=15)->int:
+        t=self.clock()
+        with self.lock:
+            self.number+=1
+            self.lookups[self.number]={'cpid':0,'delay':0.05,'due':t,'expire':t+timeout,'ppid':ppid,'window':window}
+            n=self.number
+        self.event.set()
+        return n
+
+    def Poll(self,now:float)->tuple[list[tuple[int,int,int,int]],float|None]:
+        with self.lock:d=[(i,j) for i,j in self.lookups.items() if j['due']<=now]
+        r=[]
+        w=None
+        for i,j in d:
+            if not j['cpid']:
+                if (c:=self.provider.Children(j['ppid'])) is None:
+                    r.append((i,j['ppid'],0,0))
+                    continue
+                j['cpid']=c[0] if c else 0
+            if j['cpid'] and not j['window']:r.append((i,j['ppid'],j['cpid'],0))
+            elif j['cpid'] and (h:=(w:=self.provider.Windows() if w is None else w).get(j['cpid'])):r.append((i,j['ppid'],j['cpid'],h))
+            elif now>=j['expire']:r.append((i,j['ppid'],j['cpid'],0))
+            else:
+                j['due']=min(now+j['delay'],j['expire'])
+                j['delay']=min(j['delay']*2,1)
+        with self.lock:
+            r=[i for i in r if self.lookups.pop(i[0],None)]
+            return r,min((i['due'] for i in self.lookups.values()),default=None)
+
+    def Stop(self)->None:
+        self.stopped=True
+        self.event.set()
+        if self.is_alive():self.join()
+
+    def run(self)->None:
+        n=None
+        while not self.stopped:
+            self.event.wait(None if n is None else max(n-self.clock(),0))
+            self.event.clear()
+            if self.stopped:break
+            try:r,n=self.Poll(self.clock())
+            except:r,n=[],self.clock()+1
+            for i in r:self.found(*i)
+
+class WindowProvider(typing.Protocol):
+
+    def Children(self,pid:int)->list[int]|None:
+        '''Return the ids of the child processes of pid, or None once pid no longer exists.'''
+        ...
+
+    def Windows(self)->dict[int,int]:
+        '''Return one visible top-level window handle per process id. Called at most once per discovery pass.'''
+        ...
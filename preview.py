@@ -0,0 +1,21 @@
+import typing,zlib
+
+def FrameKey(bits:bytes|memoryview,width:int,height:int,target:int)->tuple[int,int,int,int]:
+    return zlib.crc32(bits),width,height,target
+
+def ScaledSize(width:int,height:int,target:int)->tuple[int,int]:
+    return (target,max(target*height//width,1)) if target and width and target!=width else (width,height)
+
+class PreviewPipeline:
+
+    def __init__(self,render:typing.Callable[[typing.Any,int,int],typing.Any])->None:
+        self.key=None
+        self.pixmap=None
+        self.render=render
+
+    def Process(self,image:typing.Any,width:int)->tuple[typing.Any,bool]:
+        w,h=image.width(),image.height()
+        if (k:=FrameKey(image.constBits(),w,h,width))==self.key:return self.pixmap,False
+        self.key=k
+        self.pixmap=self.render(image,*ScaledSize(w,h,width))
+        return self.pixmap,True
@@ -0,0 +1,110 @@
+import datetime,typing
+
+class ProcessNode:
+    __slots__=('children','depth','details','key','lifecycle','name','parent','pid','ppid','process','root','row','status')
+    def __init__(self,name:str='',process:typing.Any=None,parent:'ProcessNode|None'=None,isroot:bool=True)->None:
+        d=process.info if process else {}
+        self.children=[]
+        self.depth=parent.depth+1 if parent else 0
+        self.details=None
+        self.key=(process.pid,d['create_time']) if process else (0,0)
+        self.lifecycle=7
+        self.name=name
+        self.parent=parent
+        self.pid=process.pid if process else 0
+        self.ppid=d.get('ppid') or 0
+        self.process=process
+        self.root=self if isroot else parent.root
+        self.row=-1
+        self.status=d.get('status') or ''
+    @property
+    def argument(self)->str:
+        return '\n'.join(f'{'　'*bool(i)*3}{j}' for i,j in enumerate(self.cmdline))
+    @property
+    def cmdline(self)->list[str]:
+        return (self.details or {}).get('cmdline') or []
+    @property
+    def file(self)->str:
+        return self.path.split('\\')[-1] or (self.process.info['name'] or '' if self.process else '')
+    @property
+    def path(self)->str:
+        return (self.details or {}).get('exe') or ''
+    @property
+    def time(self)->str:
+        return datetime.datetime.fromtimestamp(self.key[1]).strftime('%Y-%m-%d %H:%M:%S') if self.process else ''
+    @property
+    def user(self)->str:
+        return (self.details or {}).get('username') or ''
+    def Layer(self)->int:
+        return self.depth
+    def Row(self)->int:
+        return self.row
+
+class ProcessTree:
+
+    def __init__(self,listener:'ProcessTreeListener')->None:
+        self.changed=False
+        self.listener=listener
+        self.root=ProcessNode()
+
+    def Merge(self,processlist:list,snapshot:typing.Any)->bool:
+        p=snapshot.processes
+        self.changed=False
+        self.__merge(self.root,[[i[0],p[i[1]]] for i in processlist if i[1] in p],snapshot,{i[1]:i[0] for i in processlist})
+        return self.changed
+
+    def __merge(self,node:ProcessNode,children:list,snapshot:typing.Any,names:dict[int,str])->None:
+        k={i.key for i in node.children}
+        q=[]
+        for i in (i for i in children if (i[1].pid,i[1].info['create_time']) not in k):
+            try:q.append(ProcessNode(i[0],i[1],node,node is self.root))
+            except:pass
+        if q:
+            for r,i in enumerate(q,len(node.children)):i.row=r
+            self.listener.Inserting(node,len(node.children),len(node.children)+len(q)-1)
+            node.children.extend(q)
+            self.listener.Inserted()
+            self.changed=True
+        for r,i in enumerate(node.children):
+            self.__merge(i,[['',j] for j in snapshot.Children(i.pid)] if i.key in snapshot.statuses else [],snapshot,names)
+            l,m,d=i.lifecycle,i.name,i.details
+            i.details=d or snapshot.details.get(i.key)
+            try:
+                if node is self.root:i.name=names[i.pid]
+                i.status=snapshot.statuses[i.key]
+                if i.lifecycle in [3,4]:i.lifecycle=(i.status=='running')+3
+                else:i.lifecycle-=1
+            except:
+                if i.lifecycle>2:i.lifecycle=2
+                else:i.lifecycle-=1
+            if i.name!=m:self.changed=True
+            if (l,m,d)!=(i.lifecycle,i.name,i.details):self.listener.Updated(i,r)
+        for r in range(len(node.children)-1,-1,-1):
+            if node.children[r].lifecycle<1:
+                self.listener.Removing(node,r,r)
+                node.children.pop(r).row=-1
+                for i in node.children[r:]:i.row-=1
+                self.listener.Removed()
+                self.changed=True
+
+class ProcessTreeListener(typing.Protocol):
+
+    def Inserted(self)->None:
+        '''Called after the children announced by Inserting were appended.'''
+        ...
+
+    def Inserting(self,node:ProcessNode,first:int,last:int)->None:
+        '''Called before children first..last are appended to node, with their row already set.'''
+        ...
+
+    def Removed(self)->None:
+        '''Called after the child announced by Removing was removed and its siblings renumbered.'''
+        ...
+
+    def Removing(self,node:ProcessNode,first:int,last:int)->None:
+        '''Called before children first..last are removed from node.'''
+        ...
+
+    def Updated(self,node:ProcessNode,row:int)->None:
+        '''Called when the lifecycle, name or details of node, at row in its parent, changed.'''
+        ...
@@ -0,0 +1,185 @@
+from console import CommandDispatcher,WindowDiscovery
+
+class FakeSink:
+
+    def __init__(self,accept:list[int]|None=None,limit:int=1<<30)->None:
+        self.accept=accept or []
+        self.calls=[]
+        self.limit=limit
+        self.received={}
+
+    def Send(self,hwnd:int,text:str)->int:
+        self.calls.append((hwnd,text))
+        n=min(self.accept.pop(0) if self.accept else self.limit,len(text))
+        self.received[hwnd]=self.received.get(hwnd,'')+text[:n]
+        return n
+
+class FakeProvider:
+
+    def __init__(self,children:dict[int,list[int]],windows:dict[int,int]|None=None)->None:
+        self.children=children
+        self.passes=0
+        self.windows=windows or {}
+
+    def Children(self,pid:int)->list[int]|None:
+        return self.children.get(pid)
+
+    def Windows(self)->dict[int,int]:
+        self.passes+=1
+        return dict(self.windows)
+
+class FakeClock:
+
+    def __init__(self)->None:
+        self.now=100.0
+
+    def __call__(self)->float:
+        return self.now
+
+def Dispatch(sink:FakeSink,*jobs:tuple[int,str],cancel:dict[int,int]|None=None)->tuple[CommandDispatcher,list[tuple[int,str]],list[float]]:
+    r,s=[],[]
+    d=CommandDispatcher(sink,lambda i,j:r.append((i,j)),s.append)
+    if cancel:
+        send=sink.Send
+        def Send(hwnd:int,text:str)->int:
+            if len(sink.calls)==cancel.get(hwnd):d.Cancel(hwnd)
+            return send(hwnd,text)
+        d.transport=type('',(),{'Send':staticmethod(Send)})()
+    for i in jobs:d.Submit(*i)
+    d.jobs.put(None)
+    d.run()
+    return d,r,s
+
+def test_sends_whole_text_in_growing_chunks():
+    s=FakeSink()
+    d,r,_=Dispatch(s,(1,'x'*100))
+    assert r==[(1,'sent')]
+    assert s.received[1]=='x'*100
+    assert [len(i[1]) for i in s.calls]==[16,32,52]
+    assert d.pacing[1]==[128,10]
+
+def test_partial_sends_resume_where_the_sink_stopped():
+    s=FakeSink([5,0,3])
+    _,r,z=Dispatch(s,(7,'abcdefghijklmnopqrst'))
+    assert r==[(1,'sent')]
+    assert s.received[7]=='abcdefghijklmnopqrst'
+    assert [i[1] for i in s.calls[:3]]==['abcdefghijklmnop','fghijklm','fghi']
+    assert z[:3]==[0.02,0.04,0.08]
+
+def test_backoff_gives_up_when_nothing_is_accepted():
+    s=FakeSink(limit=0)
+    _,r,z=Dispatch(s,(3,'dir\r'))
+    assert r==[(1,'failed')]
+    assert 3 not in s.received or s.received[3]==''
+    assert z==[0.02,0.04,0.08,0.16,0.32,0.5]
+    assert [len(i[1]) for i in s.calls]==[4,4,4,2,1,1,1]
+
+def test_cancel_stops_the_job_and_resets_pacing():
+    s=FakeSink(limit=4)
+    d,r,_=Dispatch(s,(9,'a'*40),(9,'b'*8),(2,'c'*4),cancel={9:2})
+    assert r==[(1,'cancelled'),(2,'cancelled'),(3,'sent')]
+    assert s.received[9]=='a'*12
+    assert s.received[2]=='c'*4
+    assert 9 not in d.pacing
+    assert not d.pending
+
+def test_pacing_is_kept_per_window():
+    s=FakeSink([1,1,1])
+    d,r,_=Dispatch(s,(1,'abc'),(2,'a'*40))
+    assert r==[(1,'sent'),(2,'sent')]
+    assert d.pacing[1][0]<16<=d.pacing[2][0]
+
+def test_stop_cancels_pending_jobs():
+    import threading
+    e=threading.Event()
+    r=[]
+    class Sink:
+        def Send(self,hwnd:int,text:str)->int:
+            e.wait(5)
+            return 1
+    d=CommandDispatcher(Sink(),lambda i,j:r.append((i,j)),lambda t:None)
+    d.start()
+    d.Submit(1,'abc')
+    d.Submit(1,'def')
+    threading.Timer(0.05,e.set).start()
+    d.Stop()
+    assert not d.is_alive()
+    assert r==[(1,'cancelled'),(2,'cancelled')]
+
+def Discovery(provider:FakeProvider)->tuple[WindowDiscovery,FakeClock]:
+    c=FakeClock()
+    return WindowDiscovery(provider,lambda *i:None,c),c
+
+def test_discovery_finds_the_console_window():
+    p=FakeProvider({10:[],20:[21]},{21:0x2100})
+    d,c=Discovery(p)
+    a=d.Find(10)
+    b=d.Find(20)
+    assert d.Poll(c.now)==([(b,20,21,0x2100)],100.05)
+    p.children[10]=[11]
+    p.windows[11]=0x1100
+    c.now=100.05
+    assert d.Poll(c.now)==([(a,10,11,0x1100)],None)
+    assert p.passes==2
+    assert not d.lookups
+
+def test_discovery_shares_one_window_enumeration_per_pass():
+    p=FakeProvider({1:[2],3:[4],5:[6]},{2:7,4:8})
+    d,c=Discovery(p)
+    for i in [1,3,5]:d.Find(i)
+    r,n=d.Poll(c.now)
+    assert [i[1:] for i in r]==[(1,2,7),(3,4,8)]
+    assert p.passes==1
+    assert n==100.05
+
+def test_discovery_without_window_reports_the_child():
+    p=FakeProvider({1:[2]})
+    d,c=Discovery(p)
+    i=d.Find(1,False)
+    assert d.Poll(c.now)==([(i,1,2,0)],None)
+    assert p.passes==0
+
+def test_discovery_reports_a_vanished_process():
+    p=FakeProvider({1:[]})
+    d,c=Discovery(p)
+    i=d.Find(1)
+    assert d.Poll(c.now)[0]==[]
+    del p.children[1]
+    c.now+=0.05
+    assert d.Poll(c.now)==([(i,1,0,0)],None)
+
+def test_discovery_backs_off_and_times_out():
+    p=FakeProvider({1:[2]})
+    d,c=Discovery(p)
+    i=d.Find(1)
+    due=[]
+    while True:
+        r,n=d.Poll(c.now)
+        if r:break
+        due.append(round(n-c.now,2))
+        c.now=n
+    assert r==[(i,1,2,0)]
+    assert c.now==115
+    assert due[:6]==[0.05,0.1,0.2,0.4,0.8,1]
+    assert set(due[6:-1])=={1}
+    assert not d.lookups
+
+def test_discovery_cancel_returns_the_process():
+    p=FakeProvider({1:[]})
+    d,c=Discovery(p)
+    i=d.Find(1)
+    assert d.Cancel(i)==1
+    assert d.Cancel(i)==0
+    assert d.Poll(c.now)==([],None)
+
+def test_discovery_thread_reports_through_the_callback():
+    import threading
+    e=threading.Event()
+    r=[]
+    d=WindowDiscovery(FakeProvider({1:[2]},{2:3}),lambda *i:(r.append(i),e.set()))
+    d.start()
+    i=d.Find(1)
+    assert e.wait(5)
+    d.Stop()
+    assert not d.is_alive()
+    assert r==[(i,1,2,3)]
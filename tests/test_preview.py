@@ -0,0 +1,54 @@
+from preview import FrameKey,PreviewPipeline,ScaledSize
+
+class FakeImage:
+
+    def __init__(self,width:int,height:int,fill:int=0)->None:
+        self.bits=bytearray([fill])*(width*height*4)
+        self.size=width,height
+
+    def constBits(self)->memoryview:
+        return memoryview(self.bits)
+
+    def height(self)->int:
+        return self.size[1]
+
+    def width(self)->int:
+        return self.size[0]
+
+def Pipeline()->tuple[PreviewPipeline,list[tuple[int,int]]]:
+    r=[]
+    return PreviewPipeline(lambda i,w,h:r.append((w,h)) or (i,w,h)),r
+
+def test_scaled_size_keeps_aspect_ratio():
+    assert ScaledSize(1200,600,300)==(300,150)
+    assert ScaledSize(1000,333,300)==(300,99)
+    assert ScaledSize(3000,1,300)==(300,1)
+
+def test_scaled_size_leaves_matching_or_unscaled_frames():
+    assert ScaledSize(300,170,300)==(300,170)
+    assert ScaledSize(640,480,0)==(640,480)
+    assert ScaledSize(0,0,300)==(0,0)
+
+def test_frame_key_covers_pixels_size_and_target():
+    a=FakeImage(4,2).constBits()
+    assert FrameKey(a,4,2,300)==FrameKey(bytes(a),4,2,300)
+    assert FrameKey(a,4,2,300)!=FrameKey(FakeImage(4,2,1).constBits(),4,2,300)
+    assert FrameKey(a,4,2,300)!=FrameKey(a,2,4,300)
+    assert FrameKey(a,4,2,300)!=FrameKey(a,4,2,600)
+
+def test_pipeline_scales_changed_frames():
+    p,r=Pipeline()
+    i=FakeImage(600,300)
+    assert p.Process(i,300)==((i,300,150),True)
+    assert r==[(300,150)]
+
+def test_pipeline_skips_unchanged_frames():
+    p,r=Pipeline()
+    a,b=FakeImage(300,150),FakeImage(300,150)
+    x,u=p.Process(a,300)
+    assert u
+    assert p.Process(b,300)==(x,False)
+    b.bits[7]=1
+    assert p.Process(b,300)[1]
+    assert p.Process(b,600)[1]
+    assert r==[(300,150),(300,150),(600,300)]
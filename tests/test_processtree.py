@@ -0,0 +1,132 @@
+from processtree import ProcessNode,ProcessTree
+
+class FakeProcess:
+
+    def __init__(self,pid:int,ppid:int,created:float=1.0,status:str='running')->None:
+        self.info={'create_time':created,'name':f'p{pid}.exe','ppid':ppid,'status':status}
+        self.pid=pid
+
+class FakeSnapshot:
+
+    def __init__(self,*processes:FakeProcess,details:dict|None=None)->None:
+        self.details=details or {}
+        self.processes={i.pid:i for i in processes}
+        self.statuses={(i.pid,i.info['create_time']):i.info['status'] for i in processes}
+
+    def Children(self,pid:int)->list[FakeProcess]:
+        return [i for i in self.processes.values() if i.info['ppid']==pid and i.pid!=pid]
+
+class Recorder:
+
+    def __init__(self)->None:
+        self.events=[]
+        self.tree=ProcessTree(self)
+
+    def Inserted(self)->None:
+        self.events.append('inserted')
+
+    def Inserting(self,node:ProcessNode,first:int,last:int)->None:
+        self.events.append(('insert',node.pid,first,last))
+
+    def Merge(self,processlist:list,*processes:FakeProcess,details:dict|None=None)->list:
+        self.events=[]
+        self.tree.Merge(processlist,FakeSnapshot(*processes,details=details))
+        return [i for i in self.events if i[0]!='update']
+
+    def Removed(self)->None:
+        self.events.append('removed')
+
+    def Removing(self,node:ProcessNode,first:int,last:int)->None:
+        self.events.append(('remove',node.pid,first,last))
+
+    def Updated(self,node:ProcessNode,row:int)->None:
+        assert node.parent.children[row] is node
+        self.events.append(('update',node.pid,row))
+
+def Pids(node:ProcessNode)->list[int]:
+    return [i.pid for i in node.children]
+
+def test_first_merge_inserts_roots_then_children():
+    m=Recorder()
+    p=[FakeProcess(10,1),FakeProcess(11,10),FakeProcess(12,10),FakeProcess(20,1)]
+    assert m.Merge([['a',10],['b',20],['c',30]],*p)==[('insert',0,0,1),'inserted',('insert',10,0,1),'inserted']
+    assert m.tree.changed
+    assert Pids(m.tree.root)==[10,20]
+    assert [i.name for i in m.tree.root.children]==['a','b']
+    assert Pids(m.tree.root.children[0])==[11,12]
+
+def test_unchanged_snapshot_emits_no_structure_changes():
+    m=Recorder()
+    p=[FakeProcess(10,1),FakeProcess(11,10)]
+    m.Merge([['a',10]],*p)
+    assert m.Merge([['a',10]],*p)==[]
+    assert not m.tree.changed
+    assert ('update',11,0) in m.events
+
+def test_new_child_is_appended_as_one_range():
+    m=Recorder()
+    p=[FakeProcess(10,1),FakeProcess(11,10)]
+    m.Merge([['a',10]],*p)
+    assert m.Merge([['a',10]],*p,FakeProcess(12,10),FakeProcess(13,10))==[('insert',10,1,2),'inserted']
+    assert Pids(m.tree.root.children[0])==[11,12,13]
+
+def test_vanished_process_is_removed_after_grace_passes():
+    m=Recorder()
+    p=[FakeProcess(10,1),FakeProcess(11,10),FakeProcess(12,10)]
+    m.Merge([['a',10]],*p)
+    for _ in range(2):assert m.Merge([['a',10]],p[0],p[2])==[]
+    assert m.tree.root.children[0].children[0].lifecycle==1
+    assert m.Merge([['a',10]],p[0],p[2])==[('remove',10,0,0),'removed']
+    assert m.tree.changed
+    assert Pids(m.tree.root.children[0])==[12]
+
+def test_reused_pid_replaces_the_old_node():
+    m=Recorder()
+    m.Merge([['a',10]],FakeProcess(10,1),FakeProcess(11,10))
+    p=[FakeProcess(10,1),FakeProcess(11,10,2.0)]
+    assert m.Merge([['a',10]],*p)==[('insert',10,1,1),'inserted']
+    m.Merge([['a',10]],*p)
+    assert m.Merge([['a',10]],*p)==[('remove',10,0,0),'removed']
+    assert [i.key for i in m.tree.root.children[0].children]==[(11,2.0)]
+
+def test_details_arrival_updates_the_row():
+    m=Recorder()
+    p=[FakeProcess(10,1),FakeProcess(11,10)]
+    m.Merge([['a',10]],*p)
+    n=m.tree.root.children[0].children[0]
+    assert n.details is None and n.file=='p11.exe' and n.user==''
+    m.Merge([['a',10]],*p,details={(11,1.0):{'cmdline':['x'],'exe':'C:\\t\\x.exe','username':'u'}})
+    assert ('update',11,0) in m.events
+    assert (n.file,n.path,n.user,n.cmdline)==('x.exe','C:\\t\\x.exe','u',['x'])
+
+def AssertRows(node:ProcessNode)->None:
+    for i in node.children:
+        assert i.row==node.children.index(i)
+        assert i.depth==node.depth+1
+        AssertRows(i)
+
+def test_rows_stay_consistent_when_siblings_are_removed():
+    for k in [0,2,4]:
+        m=Recorder()
+        p=[FakeProcess(10,1)]+[FakeProcess(i,10) for i in range(11,16)]+[FakeProcess(i,11) for i in range(21,24)]
+        m.Merge([['a',10]],*p)
+        AssertRows(m.tree.root)
+        n=m.tree.root.children[0].children[k]
+        q=[i for i in p if i.pid!=n.pid and i.info['ppid']!=n.pid]
+        for _ in range(3):m.Merge([['a',10]],*q)
+        assert ('remove',10,k,k) in m.events
+        assert n.row==-1
+        assert Pids(m.tree.root.children[0])==[i for i in range(11,16) if i!=n.pid]
+        AssertRows(m.tree.root)
+
+def test_rows_stay_consistent_when_several_siblings_are_removed():
+    m=Recorder()
+    p=[FakeProcess(10,1)]+[FakeProcess(i,10) for i in range(11,18)]
+    m.Merge([['a',10]],*p)
+    q=[i for i in p if i.pid not in [11,14,17]]
+    for _ in range(3):m.Merge([['a',10]],*q)
+    assert [i for i in m.events if i[0]=='remove']==[('remove',10,6,6),('remove',10,3,3),('remove',10,0,0)]
+    assert Pids(m.tree.root.children[0])==[12,13,15,16]
+    AssertRows(m.tree.root)
+    m.Merge([['a',10]],*q,FakeProcess(18,10))
+    AssertRows(m.tree.root)
@@ -1,7 +1,7 @@
 # 1. 底层绑定库
 from shiboken6 import *
 # 2. 标准库（字母序）
-import copy,datetime,json,logging,pathlib,random,shutil,sqlite3,time
+import bisect,datetime,fnmatch,hashlib,html.parser,json,logging,pathlib,queue,random,re,shutil,sqlite3,threading,time,urllib.parse
 # 3. 系统级库（可能影响环境）
 import ctypes,win32con,win32gui,win32process,win32ui
 # 4. PySide6核心模块（层级顺序）
@@ -13,6 +13,10 @@ from PySide6.QtWebChannel import *
 from PySide6.QtWebEngineWidgets import *
 # 5. 进程/网络库（无强依赖，可延后）
 import psutil,subprocess,webbrowser
+# 6. 本地模块
+from console import *
+from preview import *
+from processtree import *
 
 def AddWatcher[T:typing.Callable](method:T)->T:
     @functools.wraps(method)
@@ -44,7 +48,12 @@ def CloseControl(control:QWidget)->None:
 
 def CreateAnimation(control:QWidget,name:bytes,startvalue:typing.Any,endvalue:typing.Any,mirror:QWidget|None=None,immediately:bool=False)->QPropertyAnimation|None:
     m=mirror or control
-    if name==b'opacity':a=QPropertyAnimation(CreateEffect(m,QGraphicsOpacityEffect,startvalue),name,m)
+    if not mirror and name!=b'opacity' and (startvalue==endvalue or appanimations.Degraded()):return appanimations.Skip(m,name,endvalue,startvalue!=endvalue)
+    appanimations.statistics['created']+=1
+    if name==b'opacity':
+        if isinstance(g:=m.graphicsEffect(),QGraphicsOpacityEffect):g.setOpacity(startvalue)
+        else:g=CreateEffect(m,QGraphicsOpacityEffect,startvalue)
+        a=QPropertyAnimation(g,name,m)
     else:
         a=QPropertyAnimation(m,name,m)
         a.setEasingCurve(QEasingCurve.Type.OutElastic)
@@ -54,12 +63,14 @@ def CreateAnimation(control:QWidget,name:bytes,startvalue:typing.Any,endvalue:ty
     if mirror:
         a.finished.connect(lambda:CloseControl(m) or (control.show() if control.parent() else None))
         a.stateChanged.connect(lambda i,j:control.hide() if i==QAbstractAnimation.State.Running and j==QAbstractAnimation.State.Stopped else None)
-    return a.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped) if immediately else a
+    return appanimations.Register([a]) or a.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped) if immediately else a
 
-def CreateAnimationsByParallel(owner:QWidget,animations:list[QPropertyAnimation],finished:typing.Callable[[],None]|None=None)->None:
+def CreateAnimationsByParallel(owner:QWidget,animations:list[QPropertyAnimation|None],finished:typing.Callable[[],None]|None=None)->None:
+    if not (a:=[i for i in animations if i]):return finished() if finished else None
     d=QParallelAnimationGroup(owner)
-    for i in animations:d.addAnimation(i)
+    for i in a:d.addAnimation(i)
     if finished:d.finished.connect(finished)
+    appanimations.Register(a)
     d.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
 
 def CreateControl[T:QWidget](controltype:typing.Type[T],parent:QWidget|None,left:int,top:int,width:int,height:int,text:str='',click:typing.Callable|None=None,tooltip:str='',icon:QIcon|None=None)->T:
@@ -105,41 +116,29 @@ def FindTopWindow(bottom:QMainWindow|QDialog|None=None)->QMainWindow|QDialog:
     while (c:=next((i for i in w.findChildren(QDialog,options=Qt.FindChildOption.FindDirectChildrenOnly) if i.isVisible()),None)):w=c
     return w
 
-def FindWindow(process:subprocess.Popen[bytes])->tuple[int,int,int]:
-    try:
-        p=psutil.Process(process.pid)
-        while not p.children():time.sleep(0.1)
-        q=p.children()[0].pid
-        while True:
-            h=win32gui.GetWindow(win32gui.GetDesktopWindow(),win32con.GW_CHILD)
-            while h:
-                if win32process.GetWindowThreadProcessId(h)[1]==q and not win32gui.GetParent(h) and win32gui.IsWindowVisible(h):return p.pid,q,h
-                h=win32gui.GetWindow(h,win32con.GW_HWNDNEXT)
-    except:return 0,0,0
-
 def GetButtonIconName(config:dict)->str:
-    if config['type']=='url':return f'file:///{apppath}/{GetExistsFileName(f'resources/shortcuts/{config['name']}.ico') or 'resources/icons/edge.png'}'
-    elif (config['path'],config['file']) in [('.','cmd.exe'),('.','powershell.exe')]:return f'file:///{apppath}/resources/icons/{config['icon']}.png'
+    if config['type']=='url':return f'toolbox:/{urllib.parse.quote(GetExistsFileName(f'resources/shortcuts/{config['name']}.ico') or 'resources/icons/edge.png')}'
+    elif (config['path'],config['file']) in [('.','cmd.exe'),('.','powershell.exe')]:return f'toolbox:/resources/icons/{config['icon']}.png'
     elif GetExistsFileName(f'{config['path']}/{config['file'].strip('"').split(' ')[-1]}'):
-        if config['icon']:return f'file:///{apppath}/resources/icons/{config['icon']}.png'
-        elif config['prefix'][:4]=='java':return f'file:///{apppath}/resources/icons/java.png'
-        elif config['prefix']=='python':return f'file:///{apppath}/resources/icons/python.png'
-        elif config['type']=='cmd':return f'file:///{apppath}/resources/icons/cmd.png'
-        else:
-            b=QBuffer()
-            GetFileIcon(f'{config['path']}/{config['file']}').pixmap(32,32).save(b,'PNG')
-            return f'data:image/png;base64,{base64.b64encode(b.data()).decode()}'
-    else:return f'file:///{apppath}/resources/icons/stopped.png'
+        if config['icon']:return f'toolbox:/resources/icons/{config['icon']}.png'
+        elif config['prefix'][:4]=='java':return f'toolbox:/resources/icons/java.png'
+        elif config['prefix']=='python':return f'toolbox:/resources/icons/python.png'
+        elif config['type']=='cmd':return f'toolbox:/resources/icons/cmd.png'
+        else:return appiconfiles.Get(f'{config['path']}/{config['file']}')
+    else:return f'toolbox:/resources/icons/stopped.png'
 
 def GetExistsFileName(filename:str)->str:
     return filename if pathlib.Path(filename).is_file() else ''
 
 def GetFileIcon(filename:str)->QIcon:
-    return appiconprovider.icon(QFileInfo(filename))
+    return appiconcache.Get(filename)
 
 def GetOutputFormat(prefix:str,filenames:list[str])->list[str]:
     return ['/'.join(filenames[0].removeprefix(prefix).split('/')[:-1]),','.join(sorted(f'*.{i}' for i in {i.split('/')[-1].split('.')[-1].lower() for i in filenames})[:5])]
 
+def GetOutputPattern(formats:str)->re.Pattern:
+    return re.compile('|'.join(fnmatch.translate(i.strip()) for i in (formats or '*.txt').split(',')),re.I)
+
 def GetPrefix(key:str)->str:
     p=appconfig['environment'].get(key)
     if key=='python':return PathSynthesis(apppath,p) if p else 'python'
@@ -172,13 +171,18 @@ def RandomName(formatname:str,existnames:list[str])->str:
     return next(i for i in iter(lambda:formatname%random.randint(0,99999999),None) if i not in existnames)
 
 def ReadDatabase(sql:str,*data:...)->list:
-    with sqlite3.connect('resources/data.db') as c:return c.execute(sql,data).fetchall()
+    return appdatabase.Read(sql,*data)
 
 def ReadFile(filename:str,jsonmode:bool=False)->dict|list|str|None:
     try:
         with pathlib.Path(filename).open(encoding='utf-8') as r:return json.load(r) if jsonmode else r.read()
     except:return None
 
+def ReadReports(tools:list[str])->dict[str,list[str]]:
+    r={i:[] for i in tools}
+    for i,j in ReadDatabase('SELECT r.tool,r.filename FROM json_each(?) t JOIN reports r ON r.rowid IN (SELECT rowid FROM reports WHERE tool=t.value ORDER BY sendtime DESC LIMIT 10) ORDER BY r.tool,r.sendtime DESC',json.dumps(tools)):r[i].append(j)
+    return r
+
 def RequestFile(kind:str,parent:QWidget,title:str,dir:str,filter:str='')->tuple[str|list[str],str]:
     d=QFileDialog(parent,title,dir,filter,fileMode={'file':QFileDialog.FileMode.ExistingFile,'files':QFileDialog.FileMode.ExistingFiles}[kind])
     d.setWindowModality(Qt.WindowModality.WindowModal)
@@ -262,18 +266,119 @@ def WidthByPixels(text:str)->int:
     return WidthByCharacters(text)*6
 
 def WriteDatabase(sql:str,*data:...)->None:
-    with sqlite3.connect('resources/data.db') as c:
-        c.execute(sql,data)
-        c.commit()
+    appdatabase.Write(sql,*data)
 
 def WriteDatabaseMany(sql:str,data:list)->None:
-    with sqlite3.connect('resources/data.db') as c:
-        c.executemany(sql,data)
-        c.commit()
+    appdatabase.WriteMany(sql,data)
 
 def WriteFile(filename:str,text:dict|list|str,jsonmode:bool=False)->None:
     with pathlib.Path(filename).open('w',encoding='utf-8') as w:json.dump(text,w,ensure_ascii=False,indent=4) if jsonmode else w.write(text)
 
+class AnimationScheduler:
+
+    def __init__(self,capacity:int,budget:float)->None:
+        self.animations={}
+        self.budget=budget
+        self.capacity=capacity
+        self.frametime=0.0
+        self.last=0.0
+        self.statistics={'created':0,'degraded':0,'skipped':0,'superseded':0}
+        self.timer=QTimer()
+        self.timer.setInterval(16)
+        self.timer.timeout.connect(self.Frame)
+
+    def Cancel(self,control:QObject,name:bytes)->None:
+        if (a:=self.animations.pop((control,name),None)) is not None and isValid(a) and a.state()==QAbstractAnimation.State.Running:
+            if (g:=a.group()):g.removeAnimation(a)
+            a.stop()
+            a.deleteLater()
+            self.statistics['superseded']+=1
+
+    def Degraded(self)->bool:
+        if not self.animations:self.frametime=0.0
+        return len(self.animations)>=self.capacity or self.frametime>self.budget
+
+    def Frame(self)->None:
+        if not self.animations:return self.timer.stop()
+        t=time.perf_counter()*1000
+        if 1<(d:=t-self.last)<500:self.frametime=self.frametime*0.8+d*0.2
+        self.last=t
+
+    def Register(self,animations:list[QPropertyAnimation])->None:
+        for i in animations:
+            k=(i.targetObject(),i.propertyName().data())
+            self.Cancel(*k)
+            self.animations[k]=i
+            i.finished.connect(lambda k=k,i=i:self.__remove(k,i))
+            i.destroyed.connect(lambda _=None,k=k,i=i:self.__remove(k,i))
+        if not self.timer.isActive():
+            self.last=time.perf_counter()*1000
+            self.timer.start()
+
+    def Skip(self,control:QObject,name:bytes,value:typing.Any,degraded:bool)->None:
+        self.Cancel(control,name)
+        control.setProperty(name.decode(),value)
+        self.statistics['degraded' if degraded else 'skipped']+=1
+
+    def Statistics(self)->dict[str,int|float]:
+        return self.statistics|{'frametime':round(self.frametime,2),'running':len(self.animations)}
+
+    def __remove(self,key:tuple[QObject,bytes],animation:QPropertyAnimation)->None:
+        if self.animations.get(key) is animation:del self.animations[key]
+
+class AssetSchemeHandler(QWebEngineUrlSchemeHandler):
+
+    def __init__(self,limit:int)->None:
+        super().__init__()
+        self.assets={
+            'bridge.js':f'{ReadFile('resources/qwebchannel.js')}document.addEventListener("DOMContentLoaded",()=>{{new QWebChannel(qt.webChannelTransport,(channel)=>{{window.webchannel=channel.objects.bridge;}})}});',
+            'doc.css':'code{color:blueviolet;cursor:pointer;}.usage{color:blue}details summary{list-style:none;}details > summary::before{content:url("toolbox:/resources/icons/closed.png");}details[open] > summary::before{content:url("toolbox:/resources/icons/opened.png");}',
+            'doc.js':'document.getElementById("show").addEventListener("click",()=>{document.querySelectorAll("details").forEach(i=>{i.open=true})});document.getElementById("hide").addEventListener("click",()=>{document.querySelectorAll("details").forEach(i=>{i.open=false})});document.querySelectorAll("summary").forEach((i)=>{i.addEventListener("click",(e)=>{if(e.target.tagName=="CODE"||window.getSelection().toString()){e.preventDefault();}})});document.addEventListener("click",(e)=>{if(e.target.tagName=="CODE")webchannel.Method([e.target.className,e.target.innerText]);});',
+            'tools.css':'button{font-size:12px;margin:0px;padding:0px;vertical-align:middle;width:200px;height:30px;}.large{width:170px;}.small{width:30px;}button img{display:inline-block;width:15px;height:15px;}pre{white-space:pre-wrap;word-wrap:break-word;}',
+            'tools.js':'document.querySelectorAll("button").forEach((i)=>{i.addEventListener("click",()=>{webchannel.Method([i.offsetWidth>100,i.name]);})});const items=[...document.getElementById("list").children];function Filter(n,m){const l=document.getElementById("list"),e=document.getElementById("empty");for(const i of items)i.hidden=true;for(const i of n){items[i].hidden=false;l.appendChild(items[i]);}e.innerText=m;e.hidden=!m;}'
+        }
+        self.cache={}
+        self.limit=limit
+        self.mimes=QMimeDatabase()
+        self.pages={}
+        self.roots={'docs/':'resources/docs','resources/iconcache/':'resources/iconcache','resources/icons/':'resources/icons','resources/shortcuts/':'resources/shortcuts'}
+
+    def Register(self,name:str,method:typing.Callable[[],str]|None)->None:
+        if method:self.pages[name]=method
+        else:self.pages.pop(name,None)
+
+    def Wrap(self,name:str,body:str)->str:
+        return f'<!DOCTYPE html><html><head><meta charset="utf-8"><link rel="stylesheet" href="toolbox:/{name}.css"><script src="toolbox:/bridge.js"></script></head><body>{body}<script src="toolbox:/{name}.js"></script></body></html>'
+
+    def __document(self,data:bytes)->bytes:
+        return self.Wrap('doc',f'<input id="show" type="button" value="全部展开"> <input id="hide" type="button" value="全部收起"> <span style="color:blue;">点击蓝色标签替换命令</span> <span style="color:blueviolet;">点击紫色标签追加选项</span> 具体替换和追加的文本跟随标签内容变化{data.decode('utf-8','replace')}').encode()
+
+    def __file(self,filename:str,convert:typing.Callable[[bytes],bytes]|None=None)->bytes|None:
+        if (m:=TryGet(os.path.getmtime,None,filename)) is None:return None
+        if not ((c:=self.cache.pop(filename,None)) and c[0]==m):
+            if (d:=TryGet(pathlib.Path(filename).read_bytes)) is None:return None
+            c=[m,convert(d) if convert else d]
+        self.cache[filename]=c
+        while len(self.cache)>self.limit:self.cache.pop(next(iter(self.cache)))
+        return c[1]
+
+    def requestStarted(self,job:QWebEngineUrlRequestJob)->None:
+        p=job.requestUrl().path().lstrip('/')
+        m=self.mimes.mimeTypeForFile(p,QMimeDatabase.MatchMode.MatchExtension).name()
+        if p in self.assets:d=self.assets[p].encode()
+        elif p in self.pages:d,m=self.pages[p]().encode(),'text/html'
+        elif (r:=next((i for i in self.roots if p.startswith(i)),None)):
+            f=os.path.normpath(os.path.join(self.roots[r],p.removeprefix(r)))
+            if TryGet(os.path.commonpath,None,[os.path.abspath(f),t:=os.path.abspath(self.roots[r])])!=t:return job.fail(QWebEngineUrlRequestJob.Error.UrlInvalid)
+            if r=='docs/':d,m=self.__file(f,self.__document) or self.__document('<h2>没有帮助文档</h2>'.encode()),'text/html'
+            else:d=self.__file(f)
+        else:d=None
+        if d is None:return job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+        b=QBuffer(job)
+        b.setData(d)
+        b.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(m.encode(),b)
+
 class ChannelBridge(QObject):
     
     def __init__(self,method:typing.Callable[[list],None])->None:
@@ -283,29 +388,409 @@ class ChannelBridge(QObject):
     def Method(self,argument:list)->None:
         self.method(argument)
 
-class ProcessNode:
-    
-    def __init__(self,name:str='',process:psutil.Process|None=None,parent:'ProcessNode|None'=None,isroot:bool=True)->None:
-        n=[psutil.NoSuchProcess]
-        self.children=[]
-        self.cmdline=TryGet(process.cmdline,n) or [] if process else []
-        self.argument='\n'.join(f'{'　'*bool(i)*3}{j}' for i,j in enumerate(self.cmdline))
-        self.lifecycle=7
-        self.name=name
-        self.parent=parent
-        self.path=TryGet(process.exe,n) or '' if process else ''
-        self.file=self.path.split('\\')[-1]
-        self.pid=process.pid if process else 0
-        self.root=self if isroot else parent.root
-        self.time=datetime.datetime.fromtimestamp(process.create_time()).strftime('%Y-%m-%d %H:%M:%S') if process else ''
-        self.user=TryGet(process.username,n) or '' if process else ''
-        if parent:parent.children.append(self)
-    @AddWatcher
-    def Layer(self)->int:
-        return 0 if self.parent is None else self.parent.Layer()+1
-    @AddWatcher
-    def Row(self)->int:
-        return self.parent.children.index(self) if self.parent and self in self.parent.children else -1
+class ConfigStore(QThread):
+    def __init__(self,filename:str,delay:int)->None:
+        super().__init__()
+        self.busy=False
+        self.condition=threading.Condition()
+        self.dirty=False
+        self.filename=filename
+        self.pending=None
+        self.timer=QTimer()
+        self.timer.setInterval(delay)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.__serialize)
+
+    def Flush(self)->None:
+        self.timer.stop()
+        if self.dirty:self.__serialize()
+        with self.condition:
+            if self.isRunning():self.condition.wait_for(lambda:self.pending is None and not self.busy)
+            elif self.pending is not None:
+                self.__write(self.pending)
+                self.pending=None
+
+    def Save(self)->None:
+        self.dirty=True
+        if not self.timer.isActive():self.timer.start()
+
+    def Stop(self)->None:
+        self.Flush()
+        self.requestInterruption()
+        with self.condition:self.condition.notify_all()
+        self.wait()
+
+    def __serialize(self)->None:
+        t=json.dumps(appconfig,ensure_ascii=False,indent=4)
+        with self.condition:
+            self.dirty=False
+            self.pending=t
+            self.condition.notify_all()
+
+    def __write(self,text:str)->None:
+        t=f'{self.filename}.tmp'
+        try:
+            with pathlib.Path(t).open('w',encoding='utf-8') as w:
+                w.write(text)
+                w.flush()
+                os.fsync(w.fileno())
+            os.replace(t,self.filename)
+        except OSError:pass
+
+    def run(self)->None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda:self.pending is not None or self.isInterruptionRequested())
+                if self.pending is None:break
+                t,self.pending=self.pending,None
+                self.busy=True
+            self.__write(t)
+            with self.condition:
+                self.busy=False
+                self.condition.notify_all()
+
+class DatabasePool:
+
+    def __init__(self,filename:str)->None:
+        self.connections=[]
+        self.filename=filename
+        self.local=threading.local()
+        self.lock=threading.Lock()
+
+    def __enter__(self)->sqlite3.Connection:
+        c=self.Connection()
+        self.local.depth=getattr(self.local,'depth',0)+1
+        return c
+
+    def __exit__(self,*exception:...)->None:
+        self.local.depth-=1
+        if not self.local.depth:
+            if exception[0]:self.Connection().rollback()
+            else:self.Connection().commit()
+
+    def Close(self)->None:
+        with self.lock:
+            for i in self.connections:
+                try:
+                    i.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                    i.close()
+                except:pass
+            self.connections.clear()
+        self.local=threading.local()
+
+    def Commit(self,connection:sqlite3.Connection)->None:
+        if not getattr(self.local,'depth',0):connection.commit()
+
+    def Connection(self)->sqlite3.Connection:
+        if (c:=getattr(self.local,'connection',None)) is None:
+            c=self.local.connection=sqlite3.connect(self.filename,timeout=10,check_same_thread=False,cached_statements=256)
+            c.execute('PRAGMA journal_mode=WAL')
+            c.execute('PRAGMA synchronous=NORMAL')
+            with self.lock:self.connections.append(c)
+        return c
+
+    def Migrate(self,migrations:list[str])->None:
+        c=self.Connection()
+        n=self.Read('PRAGMA user_version')[0][0]
+        for i,j in enumerate(migrations[n:],n+1):
+            try:c.executescript(f'BEGIN;{j}PRAGMA user_version={i};COMMIT;')
+            except:
+                if c.in_transaction:c.rollback()
+                raise
+
+    def Read(self,sql:str,*data:...)->list:
+        return self.Connection().execute(sql,data).fetchall()
+
+    def Write(self,sql:str,*data:...)->None:
+        c=self.Connection()
+        c.execute(sql,data)
+        self.Commit(c)
+
+    def WriteMany(self,sql:str,data:list)->None:
+        c=self.Connection()
+        c.executemany(sql,data)
+        self.Commit(c)
+
+class DocParser(html.parser.HTMLParser):
+
+    def __init__(self)->None:
+        super().__init__()
+        self.options=[]
+        self.stack=[]
+        self.text=[]
+
+    def handle_data(self,data:str)->None:
+        self.text.append(data)
+        if self.stack:
+            l=self.stack[-1]
+            if l['code']:l['code'][1].append(data)
+            l['text'].append(data)
+
+    def handle_endtag(self,tag:str)->None:
+        if not self.stack:return
+        l=self.stack[-1]
+        if tag=='code' and l['code']:
+            l['codes'].append((l['code'][0],''.join(l['code'][1]).strip(),l['code'][2],len(''.join(l['text']))))
+            l['code']=None
+        elif tag=='li':self.__option(self.stack.pop())
+
+    def handle_starttag(self,tag:str,attrs:list[tuple[str,str|None]])->None:
+        if tag=='li':self.stack.append({'code':None,'codes':[],'text':[]})
+        elif tag=='code' and self.stack:self.stack[-1]['code']=[dict(attrs).get('class') or '',[],len(''.join(self.stack[-1]['text']))]
+
+    def __option(self,item:dict)->None:
+        t=''.join(item['text'])
+        if not (c:=item['codes']) or c[0][0] or not c[0][1].startswith('-') or t[:c[0][2]].strip():return
+        a=[]
+        f=[]
+        for i in re.split(r'[,\s]+',c[0][1]):
+            if i.startswith('-') and not a:
+                f.append(i.partition('=')[0])
+                if i.partition('=')[2]:a.append(i.partition('=')[2])
+            elif i:a.append(i)
+        d=''
+        if m:=re.search(r'默认值?[：:为]\s*',t):d=next((i[1] for i in c[1:] if i[2]==m.end()),None) or ((n:=re.match(r'[^\s，,；;。）)]+',t[m.end():])) and n.group(0)) or ''
+        e=json.dumps([i[1] for i in c if i[0]=='full'],ensure_ascii=False)
+        n=t[c[0][3]:].strip().lstrip('：:').strip()
+        self.options.extend((i,', '.join(f),' '.join(a),d,n,e) for i in f)
+
+class FullTextIndex:
+    pattern=re.compile(r'([\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff])')
+    restore=re.compile(r' ?(\x02?[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff]\x03?) ?')
+
+    def Query(self,query:str)->str:
+        t=[i for i in (re.findall(r'[^\W_]+',self.Segment(i)) for i in query.split()) if i]
+        return ' '.join(f'"{' '.join(j)}"{'*' if i==len(t)-1 and j[-1].isascii() else ''}' for i,j in enumerate(t))
+
+    def Search(self,query:str,limit:int=100)->list[tuple[str,str,str]]:
+        if not (q:=self.Query(query)):return []
+        return [(i,j,self.restore.sub(r'\1',k).replace('\x03\x02','').replace('\x02','【').replace('\x03','】')) for i,j,k in ReadDatabase('SELECT name,kind,snippet(fulltext,-1,?,?,?,24) FROM fulltext WHERE fulltext MATCH ? ORDER BY bm25(fulltext,0,0,10,1) LIMIT ?','\x02','\x03','…',q,limit)]
+
+    def Segment(self,text:str)->str:
+        return self.pattern.sub(r' \1 ',text)
+
+    def Synchronize(self,programs:list[dict])->None:
+        d=dict(ReadDatabase('SELECT name,body FROM fulltext WHERE kind=?','tool'))
+        n={i['name']:i for i in programs}
+        with appdatabase:
+            for i in d.keys()-n.keys():self.Update(i,'tool',None)
+            for i,j in n.items():
+                if d.get(i)!=self.Segment(j['note']):self.Update(i,'tool',j['note'])
+
+    def Update(self,name:str,kind:str,body:str|None)->None:
+        with appdatabase:
+            WriteDatabase('DELETE FROM fulltext WHERE name=? AND kind=?',name,kind)
+            if body is not None:WriteDatabase('INSERT INTO fulltext VALUES (?,?,?,?)',name,kind,self.Segment(name),self.Segment(body))
+
+class HistoryWriter(QThread):
+    def __init__(self)->None:
+        super().__init__()
+        self.jobs=queue.Queue()
+
+    def Flush(self)->None:
+        if self.isRunning():self.jobs.join()
+
+    def Stop(self)->None:
+        self.jobs.put(None)
+        self.wait()
+
+    def Submit(self,*record:str)->None:
+        self.jobs.put(record)
+
+    def run(self)->None:
+        while True:
+            b=[self.jobs.get()]
+            try:
+                while True:b.append(self.jobs.get_nowait())
+            except queue.Empty:pass
+            if r:=[i for i in b if i is not None]:
+                try:
+                    with appdatabase:WriteDatabaseMany('INSERT INTO history VALUES (?,?,?)',r)
+                except sqlite3.Error:pass
+            for _ in b:self.jobs.task_done()
+            if len(r)<len(b):break
+
+class IconCache:
+
+    def __init__(self,capacity:int)->None:
+        self.capacity=capacity
+        self.hits=0
+        self.items={}
+        self.misses=0
+
+    def Get(self,filename:str)->QIcon:
+        n=str(filename).replace('\\','/')
+        e=n.split('/')[-1].rpartition('.')[2].lower() if '.' in n.split('/')[-1] else ''
+        k=n.lower() if e in ['','exe','ico','lnk'] else f'*.{e}'
+        if k[:2]=='*.' and k not in self.items and os.path.isdir(n):k=n.lower()
+        t=time.monotonic()
+        if (i:=self.items.pop(k,None)):
+            if k[:2]!='*.' and t-i[2]>=1:
+                if TryGet(os.path.getmtime,None,n)!=i[1]:i=None
+                else:i[2]=t
+            if i:
+                self.hits+=1
+                self.items[k]=i
+                return i[0]
+        self.misses+=1
+        i=[appiconprovider.icon(QFileInfo(n)),None if k[:2]=='*.' else TryGet(os.path.getmtime,None,n),t]
+        self.items[k]=i
+        while len(self.items)>self.capacity:del self.items[next(iter(self.items))]
+        return i[0]
+
+    def Statistics(self)->dict[str,int]:
+        return {'hits':self.hits,'misses':self.misses,'size':len(self.items)}
+
+class IconFileCache:
+
+    def __init__(self,folder:str)->None:
+        self.changed=False
+        self.folder=folder
+        self.index=ReadFile(f'{folder}/index.json',True) or {}
+
+    def Get(self,filename:str)->str:
+        k=str(filename).replace('\\','/').lower()
+        m=TryGet(os.path.getmtime,None,filename)
+        n=f'{self.folder}/{hashlib.md5(k.encode()).hexdigest()}.png'
+        if self.index.get(k)!=m or not pathlib.Path(n).is_file():
+            pathlib.Path(self.folder).mkdir(parents=True,exist_ok=True)
+            GetFileIcon(filename).pixmap(32,32).save(n,'PNG')
+            self.changed=True
+            self.index[k]=m
+        return f'toolbox:/{n}?{int(m or 0)}'
+
+    def Save(self)->None:
+        if self.changed:
+            WriteFile(f'{self.folder}/index.json',self.index,True)
+            self.changed=False
+
+class OptionIndex:
+
+    def __init__(self,folder:str)->None:
+        self.folder=folder
+        self.items={}
+
+    def Lookup(self,name:str,prefix:str)->list[tuple[str,str,str,str,str,str]]:
+        r=self.Options(name)
+        return r[bisect.bisect_left(r,(prefix,)):bisect.bisect_left(r,(f'{prefix}\U0010ffff',))]
+
+    def Options(self,name:str)->list[tuple[str,str,str,str,str,str]]:
+        f=f'{self.folder}/{name}.html'
+        m=TryGet(os.path.getmtime,None,f)
+        if (c:=self.items.get(name)) and c[0]==m:return c[1]
+        if m is None:
+            r=[]
+            self.__remove(name)
+        elif ReadDatabase('SELECT mtime FROM docs WHERE name=?',name)==[(m,)]:r=ReadDatabase('SELECT flag,aliases,argument,defaultvalue,description,examples FROM options WHERE name=? ORDER BY flag',name)
+        else:r=self.__compile(name,f,m)
+        self.items[name]=(m,r)
+        return r
+
+    def Rebuild(self)->int:
+        n={i.name[:-5]:i.stat().st_mtime for i in os.scandir(self.folder) if i.is_file() and i.name.endswith('.html')}
+        d=dict(ReadDatabase('SELECT name,mtime FROM docs'))
+        for i in d.keys()-n.keys():self.__remove(i)
+        c=[i for i,j in n.items() if d.get(i)!=j]
+        for i in c:self.__compile(i,f'{self.folder}/{i}.html',n[i])
+        return len(c)
+
+    def __compile(self,name:str,filename:str,mtime:float)->list[tuple[str,str,str,str,str,str]]:
+        p=DocParser()
+        p.feed(ReadFile(filename) or '')
+        p.close()
+        r={}
+        for i in p.options:r.setdefault(i[0],i)
+        r=sorted(r.values())
+        with appdatabase:
+            WriteDatabase('DELETE FROM options WHERE name=?',name)
+            WriteDatabaseMany('INSERT INTO options VALUES (?,?,?,?,?,?,?)',[(name,*i) for i in r])
+            WriteDatabase('INSERT OR REPLACE INTO docs VALUES (?,?)',name,mtime)
+            appfulltext.Update(name,'doc',' '.join(' '.join(p.text).split()))
+        return r
+
+    def __remove(self,name:str)->None:
+        with appdatabase:
+            WriteDatabase('DELETE FROM options WHERE name=?',name)
+            WriteDatabase('DELETE FROM docs WHERE name=?',name)
+            appfulltext.Update(name,'doc',None)
+
+class PostMessageTransport(KeystrokeTransport):
+
+    def Send(self,hwnd:int,text:str)->int:
+        for i,j in enumerate(text):
+            try:win32gui.PostMessage(hwnd,win32con.WM_CHAR,ord(j),0)
+            except:return i
+        return len(text)
+
+class ProcessCache:
+
+    def __init__(self,capacity:int)->None:
+        self.capacity=capacity
+        self.items={}
+        self.lock=threading.Lock()
+
+    def Get(self,process:psutil.Process|None)->dict:
+        if process is None:return {'cmdline':None,'exe':None,'username':None}
+        k=(process.pid,process.info['create_time'])
+        with self.lock:
+            if k in self.items:
+                self.items[k]=self.items.pop(k)
+                return self.items[k]
+        try:d=process.as_dict(['cmdline','exe','username'])
+        except:d={'cmdline':None,'exe':None,'username':None}
+        with self.lock:
+            self.items[k]=d
+            while len(self.items)>self.capacity:del self.items[next(iter(self.items))]
+        return d
+
+class ProcessSampler(QThread):
+    signaler=Signal(object)
+    def __init__(self,roots:typing.Callable[[],list[int]])->None:
+        super().__init__()
+        self.busy=False
+        self.event=threading.Event()
+        self.roots=roots
+
+    def Request(self)->None:
+        self.busy=True
+        self.event.set()
+
+    def Stop(self)->None:
+        self.requestInterruption()
+        self.event.set()
+        self.wait()
+
+    def run(self)->None:
+        while not self.isInterruptionRequested():
+            self.event.wait()
+            self.event.clear()
+            if self.isInterruptionRequested():break
+            try:self.signaler.emit(ProcessSnapshot(self.roots()))
+            except:self.busy=False
+
+class ProcessSnapshot:
+
+    def __init__(self,roots:typing.Sequence[int]=())->None:
+        t=time.perf_counter()
+        self.children={}
+        self.processes={}
+        self.statuses={}
+        for i in psutil.process_iter(['ppid','name','status','create_time']):
+            i.info['create_time']=i.info['create_time'] or 0
+            self.children.setdefault(i.info['ppid'],[]).append(i)
+            self.processes[i.pid]=i
+            self.statuses[(i.pid,i.info['create_time'])]=i.info['status']
+        self.details={(i.pid,i.info['create_time']):appprocesscache.Get(i) for i in [self.processes[i] for i in roots if i in self.processes]+self.Descendants(*roots)}
+        self.cost=(time.perf_counter()-t)*1000
+
+    def Children(self,pid:int)->list[psutil.Process]:
+        t=self.processes[pid].info['create_time'] if pid in self.processes else 0
+        return [i for i in self.children.get(pid,[]) if i.pid!=pid and i.info['create_time']>=t]
+
+    def Descendants(self,*pids:int)->list[psutil.Process]:
+        r=[j for i in pids for j in self.Children(i)]
+        for i in r:r.extend(self.Children(i.pid))
+        return r
 
 class ProcessTreeModel(QAbstractItemModel):
     @AddWatcher
@@ -313,39 +798,28 @@ class ProcessTreeModel(QAbstractItemModel):
         super().__init__()
         self.filter=''
         self.header=['进程名','进程号','工具名']
-        self.root=ProcessNode()
-        self.rootoffscreen=None
-    @AddWatcher
-    def RefreshTree(self,processlist:list)->None:
-        self.beginResetModel()
-        self.rootoffscreen=copy.deepcopy(self.root)
-        self.root.children.clear()
-        self.__rebuidtree(self.rootoffscreen,processlist)
-        self.root=self.rootoffscreen
-        self.endResetModel()
-    @AddWatcher
-    def __rebuidtree(self,node:ProcessNode,processlist:list|None=None)->None:
-        p=[i.pid for i in node.children]
-        if node is self.rootoffscreen:
-            for i in [i for i in processlist if i[1] not in p]:
-                try:ProcessNode(i[0],psutil.Process(i[1]),node)
-                except:pass
-        else:
-            try:
-                for i in [i for i in psutil.Process(node.pid).children() if i.pid not in p]:
-                    try:ProcessNode('',i,node,False)
-                    except:pass
-            except:pass
-        for i in node.children:self.__rebuidtree(i)
-        for i in node.children.copy():
-            try:
-                if node is self.rootoffscreen:i.name=next(j for j in processlist if j[1]==i.pid)[0]
-                if i.lifecycle in [3,4]:i.lifecycle=(psutil.Process(i.pid).status()==psutil.STATUS_RUNNING)+3
-                else:i.lifecycle-=1
-            except:
-                if i.lifecycle>2:i.lifecycle=2
-                else:i.lifecycle-=1
-            if not i.lifecycle:node.children.remove(i)
+        self.tree=ProcessTree(self)
+    @AddWatcher
+    def Inserted(self)->None:
+        self.endInsertRows()
+    @AddWatcher
+    def Inserting(self,node:ProcessNode,first:int,last:int)->None:
+        self.beginInsertRows(self.__nodeindex(node),first,last)
+    @AddWatcher
+    def RefreshTree(self,processlist:list,snapshot:ProcessSnapshot)->bool:
+        return self.tree.Merge(processlist,snapshot)
+    @AddWatcher
+    def Removed(self)->None:
+        self.endRemoveRows()
+    @AddWatcher
+    def Removing(self,node:ProcessNode,first:int,last:int)->None:
+        self.beginRemoveRows(self.__nodeindex(node),first,last)
+    @AddWatcher
+    def Updated(self,node:ProcessNode,row:int)->None:
+        self.dataChanged.emit(self.createIndex(row,0,node),self.createIndex(row,2,node))
+    @AddWatcher
+    def __nodeindex(self,node:ProcessNode)->QModelIndex:
+        return QModelIndex() if node is self.tree.root else self.createIndex(node.Row(),0,node)
     @AddWatcher
     def columnCount(self,parent:QModelIndex)->int:
         return 3
@@ -355,13 +829,13 @@ class ProcessTreeModel(QAbstractItemModel):
         n=index.internalPointer()
         match role:
             case Qt.ItemDataRole.BackgroundRole:
-                return QBrush(Qt.GlobalColor.red if n.lifecycle<3 else Qt.GlobalColor.gray if n.lifecycle==3 else Qt.GlobalColor.green if n.lifecycle>4 else Qt.GlobalColor.magenta if n.root.name.startswith('[待捕捉] ') else Qt.GlobalColor.darkRed if n.user!=appuser else Qt.GlobalColor.transparent)
+                return QBrush(Qt.GlobalColor.red if n.lifecycle<3 else Qt.GlobalColor.gray if n.lifecycle==3 else Qt.GlobalColor.green if n.lifecycle>4 else Qt.GlobalColor.magenta if n.root.name.startswith('[待捕捉] ') else Qt.GlobalColor.darkRed if n.details and n.user!=appuser else Qt.GlobalColor.transparent)
             case Qt.ItemDataRole.DecorationRole:
                 if not index.column():return GetFileIcon(n.path)
             case Qt.ItemDataRole.DisplayRole:return [n.file,n.pid,n.name][index.column()]
             case Qt.ItemDataRole.ForegroundRole:
                 if self.filter and self.filter in f'{n.file.lower()}\n{n.name.lower()}':return QBrush(Qt.GlobalColor.blue)
-            case Qt.ItemDataRole.ToolTipRole:return f'文件：{n.path}\n参数：{n.argument}\n用户：{n.user}\n启动：{n.time}'
+            case Qt.ItemDataRole.ToolTipRole:return f'文件：{n.path}\n参数：{n.argument}\n用户：{n.user}\n启动：{n.time}' if n.details or not n.process else f'文件：读取中…\n启动：{n.time}'
         return None
     @AddWatcher
     def headerData(self,section:int,orientation:Qt.Orientation,role:Qt.ItemDataRole)->str:
@@ -369,14 +843,14 @@ class ProcessTreeModel(QAbstractItemModel):
         return self.header[section]
     @AddWatcher
     def index(self,row:int,column:int,parent:QModelIndex)->QModelIndex:
-        p=parent.internalPointer() if parent.isValid() else self.root
+        p=parent.internalPointer() if parent.isValid() else self.tree.root
         return self.createIndex(row,column,p.children[row]) if 0<=row<len(p.children) else QModelIndex()
     @AddWatcher
     def parent(self,index:QModelIndex)->QModelIndex:
-        return self.createIndex(r,0,p.parent) if isinstance(p:=index.internalPointer(),ProcessNode) and p.parent is not self.root and (r:=p.parent.Row())>-1 else QModelIndex()
+        return self.createIndex(r,0,p.parent) if isinstance(p:=index.internalPointer(),ProcessNode) and p.parent is not self.tree.root and (r:=p.parent.Row())>-1 else QModelIndex()
     @AddWatcher
     def rowCount(self,parent:QModelIndex)->int:
-        return len((parent.internalPointer() if parent.isValid() else self.root).children)
+        return len((parent.internalPointer() if parent.isValid() else self.tree.root).children)
 
 class ShowErrorHandler(logging.Handler):
 
@@ -392,16 +866,193 @@ class ShowErrorHandler(logging.Handler):
         elif n>9 or self.records[-1][0]-self.records[-3][0]<1 or RequestMessage('c',FindTopWindow(),'错误',f'报错太多，是否强制退出程序？\n{record.msg}',QMessageBox.StandardButton.Yes|QMessageBox.StandardButton.No,QMessageBox.StandardButton.Yes)==QMessageBox.StandardButton.Yes:
             FileOperation('x','resources/pyvenv.cfg','pyvenv.cfg')
             mainwindow.tab_area.CleanUp(appconfig['general']['grab']+3)
+            mainwindow.configstore.Flush()
+            mainwindow.historywriter.Flush()
             os._exit(1)
 
-class WindowFounder(QThread):
-    signaler=Signal(int,int,int)
-    def __init__(self,path:str)->None:
-        super().__init__()
-        self.path=path
+class TickScheduler:
 
-    def run(self)->None:
-        self.signaler.emit(*FindWindow(subprocess.Popen(f'conhost cmd /k "cd /d {self.path}"',creationflags=subprocess.CREATE_NEW_CONSOLE)))
+    def __init__(self)->None:
+        self.statistics={}
+        self.tasks={}
+        self.timer=QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.__tick)
+
+    def Add(self,name:str,method:typing.Callable[[],None],interval:typing.Callable[[],int],busy:typing.Callable[[],bool]=lambda:False)->None:
+        self.statistics[name]={'cost':0.0,'last':0.0,'skipped':0,'ticks':0}
+        self.tasks[name]=[method,interval,busy,time.monotonic()]
+        self.__arm()
+
+    def Report(self,name:str,cost:float)->None:
+        s=self.statistics[name]
+        s['cost']=s['cost']*0.9+cost*0.1 if s['ticks'] else cost
+        s['last']=cost
+        s['ticks']+=1
+
+    def Statistics(self)->dict[str,dict]:
+        return {i:{k:round(l,2) for k,l in j.items()} for i,j in self.statistics.items()}
+
+    def Wake(self,name:str)->None:
+        self.tasks[name][3]=time.monotonic()
+        self.__arm()
+
+    def __arm(self)->None:
+        self.timer.start(max(int((min(i[3] for i in self.tasks.values())-time.monotonic())*1000),0))
+
+    def __interval(self,interval:typing.Callable[[],int])->int:
+        try:return interval()
+        except:
+            logging.getLogger('main').error(traceback.format_exc())
+            return 1000
+
+    def __tick(self)->None:
+        t=time.monotonic()
+        try:
+            for i,j in list(self.tasks.items()):
+                if j[3]>t:continue
+                try:
+                    if j[2]():self.statistics[i]['skipped']+=1
+                    else:
+                        c=time.perf_counter()
+                        j[0]()
+                        if not j[2]():self.Report(i,(time.perf_counter()-c)*1000)
+                except:logging.getLogger('main').error(traceback.format_exc())
+                finally:j[3]=t+self.__interval(j[1])/1000
+        finally:self.__arm()
+
+class ToolSearcher:
+    boundaries=[45217,45253,45761,46318,46826,47010,47297,47614,48119,49062,49324,49896,50371,50614,50622,50906,51387,51446,52218,52698,52980,53689,54481,55290]
+    def __init__(self,programs:list[dict])->None:
+        self.postings={}
+        self.targets={}
+        self.version=0
+        for i in programs:self.Update(i['name'],i)
+
+    def Initials(self,text:str)->str:
+        r=[]
+        for i in text.lower():
+            if i.isascii():
+                if i.isalnum():r.append(i)
+            elif len(c:=i.encode('gbk','ignore'))==2 and self.boundaries[0]<=(n:=c[0]<<8|c[1])<self.boundaries[-1]:r.append('abcdefghjklmnopqrstwxyz'[bisect.bisect(self.boundaries,n)-1])
+        return ''.join(r)
+
+    def Search(self,query:str)->list[str]:
+        q=query.lower()
+        if not q:return []
+        g=sorted((self.postings.get(i,set()) for i in ({q} if len(q)<2 else {q[i:i+2] for i in range(len(q)-1)})),key=len)
+        return sorted((i for i in g[0].intersection(*g[1:]) if q in self.targets[i][0]),key=lambda i:(self.targets[i][1]!=q,not self.targets[i][1].startswith(q),q not in self.targets[i][1],not self.targets[i][2].startswith(q),q not in self.targets[i][2],self.targets[i][1]))
+
+    def Update(self,name:str,tool:dict|None)->None:
+        if name in self.targets:
+            t=self.targets.pop(name)[0]
+            for i in set(t)|{t[i:i+2] for i in range(len(t)-1)}:
+                self.postings[i].discard(name)
+                if not self.postings[i]:del self.postings[i]
+        if tool:
+            n=tool['name']
+            p=self.Initials(n)
+            t=f'{n}\n{tool['note']}\n{p}'.lower()
+            self.targets[n]=[t,n.lower(),p]
+            for i in set(t)|{t[i:i+2] for i in range(len(t)-1)}:self.postings.setdefault(i,set()).add(n)
+        self.version+=1
+
+class WebPagePool:
+
+    def __init__(self)->None:
+        self.holder=None
+        self.idle=[]
+        self.profile=None
+
+    def Acquire(self,key:str,parent:QWidget,left:int,top:int,width:int,height:int,method:typing.Callable[[list],None]=lambda _:None,hider:typing.Callable[[],None]|None=None,loader:typing.Callable[[],None]|None=None)->'WebArea':
+        if (v:=next((i for i in self.idle if i[0].key==key),None) or (self.idle[0] if self.idle else None)):
+            self.idle.remove(v)
+            w=v[0]
+        else:w=self.__create()
+        w.Bind(parent,left,top,width,height,method,hider,loader)
+        w.Load(key)
+        return w
+
+    def Close(self)->None:
+        self.__trim(0)
+
+    def Evict(self)->None:
+        t=time.monotonic()-appconfig['webpool']['idletime']
+        while len(self.idle)>appconfig['webpool']['warm'] and self.idle[0][1]<t:
+            CloseControl(self.idle.pop(0)[0])
+
+    def Release(self,view:'WebArea|None')->None:
+        if view:
+            view.hide()
+            view.Bind(self.holder,0,0,view.width(),view.height())
+            self.idle.append([view,time.monotonic()])
+            self.__trim(appconfig['webpool']['idle'])
+
+    def Warm(self)->None:
+        for _ in range(appconfig['webpool']['warm']-len(self.idle)):
+            (w:=self.__create()).Load('about:blank')
+            self.idle.append([w,time.monotonic()])
+
+    def __create(self)->'WebArea':
+        if not self.holder:
+            self.holder=QWidget()
+            self.profile=QWebEngineProfile(QApplication.instance())
+            self.profile.installUrlSchemeHandler(b'toolbox',appassets)
+        return WebArea(self.holder,self.profile)
+
+    def __trim(self,size:int)->None:
+        while len(self.idle)>size:
+            CloseControl(self.idle.pop(0)[0])
+
+class Win32WindowProvider(WindowProvider):
+
+    def Children(self,pid:int)->list[int]|None:
+        try:return [i.pid for i in psutil.Process(pid).children()]
+        except psutil.Error:return None
+
+    def Windows(self)->dict[int,int]:
+        r={}
+        def Collect(hwnd:int,_)->bool:
+            if not win32gui.GetParent(hwnd) and win32gui.IsWindowVisible(hwnd):r.setdefault(win32process.GetWindowThreadProcessId(hwnd)[1],hwnd)
+            return True
+        try:win32gui.EnumWindows(Collect,None)
+        except:pass
+        return r
+
+class OptionCompleter(QCompleter):
+    @AddWatcher
+    def __init__(self,parent:QLineEdit,name:typing.Callable[[],str])->None:
+        super().__init__(parent)
+        self.completed=False
+        self.name=name
+        self.options=QStandardItemModel(self)
+        self.rows=None
+        self.setCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+        self.setMaxVisibleItems(12)
+        self.setModel(self.options)
+        self.setModelSorting(QCompleter.ModelSorting.CaseSensitivelySortedModel)
+        self.Refresh()
+        parent.setCompleter(self)
+    @AddWatcher
+    def Refresh(self,prefix:str='-')->None:
+        if (r:=appoptions.Lookup(self.name(),prefix))!=self.rows:
+            self.rows=r
+            self.options.clear()
+            for i in r:
+                (j:=QStandardItem(i[0])).setToolTip('\n'.join(k for k in [f'{i[1]} {i[2]}'.strip(),i[4],f'默认值：{i[3]}' if i[3] else '',*(f'例如：{k}' for k in json.loads(i[5]))] if k))
+                self.options.appendRow(j)
+    @AddWatcher
+    def eventFilter(self,watched:QObject,event:QEvent)->bool:
+        if watched is self.popup() and event.type()==QEvent.Type.KeyPress and event.key() in [Qt.Key.Key_Enter,Qt.Key.Key_Return]:self.completed=self.popup().isVisible() and self.popup().currentIndex().isValid()
+        return super().eventFilter(watched,event)
+    @AddWatcher
+    def pathFromIndex(self,index:QModelIndex)->str:
+        t=self.widget().text()
+        return f'{t[:len(t)-len(t.split(' ')[-1])]}{index.data()}'
+    @AddWatcher
+    def splitPath(self,path:str)->list[str]:
+        if (t:=path.split(' ')[-1]).startswith('-'):self.Refresh(t)
+        return [t if t.startswith('-') else '\0']
 
 class RadioButtonGroup(QWidget):
     @AddWatcher
@@ -439,15 +1090,18 @@ class ScrollableGroup(QGroupBox):
 
 class WebArea(QWebEngineView):
     @AddWatcher
-    def __init__(self,parent:QWidget,left:int,top:int,width:int,height:int,html:str,method:typing.Callable[[list],None]=lambda _:None,hider:typing.Callable[[],None]|None=None)->None:
+    def __init__(self,parent:QWidget,profile:QWebEngineProfile)->None:
         super().__init__(parent)
-        self.bridge=ChannelBridge(method)
+        self.bridge=ChannelBridge(lambda _:None)
         self.channel=QWebChannel()
         self.channel.registerObject('bridge',self.bridge)
-        self.hider=hider
-        self.setGeometry(left,top,width,height)
-        self.setHtml(html,QUrl(apppath))
+        self.hider=None
+        self.key=None
+        self.loaded=False
+        self.loader=None
+        self.setPage(QWebEnginePage(profile,self))
         self.page().setWebChannel(self.channel)
+        self.loadFinished.connect(self.__loadfinished)
         QShortcut(QKeySequence('Ctrl+C'),self).activated.connect(self.__shortcutctrlc)
         QShortcut(QKeySequence('Ctrl+Q'),self).activated.connect(self.__shortcutctrlq)
         self.web_menu=QMenu(self)
@@ -472,6 +1126,20 @@ class WebArea(QWebEngineView):
         self.find_hide.setAutoRaise(True)
         self.find_hide.setText('×')
     @AddWatcher
+    def Bind(self,parent:QWidget,left:int,top:int,width:int,height:int,method:typing.Callable[[list],None]=lambda _:None,hider:typing.Callable[[],None]|None=None,loader:typing.Callable[[],None]|None=None)->None:
+        if self.find_area.isVisible():self.WebFinderSwitch()
+        self.bridge.method=method
+        self.hider=hider
+        self.loader=loader
+        self.setParent(parent)
+        self.setGeometry(left,top,width,height)
+    @AddWatcher
+    def Load(self,key:str)->None:
+        if key!=self.key:
+            self.key=key
+            self.loaded=False
+            self.setUrl(QUrl(key))
+    @AddWatcher
     def WebFinderSwitch(self)->None:
         if self.find_area.isVisible():
             self.find_text.setText('')
@@ -485,6 +1153,10 @@ class WebArea(QWebEngineView):
             self.find_text.setText(self.page().selectedText())
             self.find_text.setFocus()
     @AddWatcher
+    def __loadfinished(self,event:bool)->None:
+        self.loaded=True
+        if self.loader:self.loader()
+    @AddWatcher
     def __shortcutctrlc(self)->None:
         self.triggerPageAction(QWebEnginePage.WebAction.Copy)
     @AddWatcher
@@ -522,7 +1194,8 @@ class WebArea(QWebEngineView):
         return super().resizeEvent(event)
 
 class MainWindow(QMainWindow):
-
+    commandfinished=Signal(int,str)
+    windowdiscovered=Signal(int,int,int,int)
     def __init__(self)->None:
         super().__init__()
         m=logging.getLogger('main')
@@ -531,11 +1204,37 @@ class MainWindow(QMainWindow):
         n.setFormatter(logging.Formatter(f'{'-'*32}\n%(asctime)s\n%(name)s:%(message)s'))
         m.addHandler(n)
         m.addHandler(ShowErrorHandler())
-        appconfig.update({'general':{'animetime':0.5,'preview':True,'grab':True},'favority':[],'history':{'record':True,'maxshown':99,'orderbycount':True},'process':{'autorefresh':True,'pintop':True},'environment':{'java':'','java8':'Java_path/Java_8_win/bin/java','java9+':'Java_path/Java_11_win/bin/java','python':'Python3.11.9/python'},'residual':[]}|(ReadFile('resources/config.json',True) or {}))
-        self.htmlhead=f'<style>code{{color:blueviolet;cursor:pointer;}}.usage{{color:blue}}details summary{{list-style:none;}}details > summary::before{{content:url("{apppath}/resources/icons/closed.png");}}details[open] > summary::before{{content:url("{apppath}/resources/icons/opened.png");}}</style><input id="show" type="button" value="全部展开"> <input id="hide" type="button" value="全部收起"> <span style="color:blue;">点击蓝色标签替换命令</span> <span style="color:blueviolet;">点击紫色标签追加选项</span> 具体替换和追加的文本跟随标签内容变化'
-        self.htmlroot=f'{ReadFile('resources/qwebchannel.js')}document.addEventListener("DOMContentLoaded",()=>{{new QWebChannel(qt.webChannelTransport,(channel)=>{{window.webchannel=channel.objects.bridge;}})}});'
-        self.htmltail='document.getElementById("show").addEventListener("click",()=>{document.querySelectorAll("details").forEach(i=>{i.open=true})});document.getElementById("hide").addEventListener("click",()=>{document.querySelectorAll("details").forEach(i=>{i.open=false})});document.querySelectorAll("summary").forEach((i)=>{i.addEventListener("click",(e)=>{if(e.target.tagName=="CODE"||window.getSelection().toString()){e.preventDefault();}})});document.addEventListener("click",(e)=>{if(e.target.tagName=="CODE")webchannel.Method([e.target.className,e.target.innerText]);});'
+        appconfig.update({'general':{'animetime':0.5,'preview':True,'grab':True},'favority':[],'history':{'record':True,'maxshown':99,'orderbycount':True},'process':{'autorefresh':True,'pintop':True},'environment':{'java':'','java8':'Java_path/Java_8_win/bin/java','java9+':'Java_path/Java_11_win/bin/java','python':'Python3.11.9/python'},'residual':[],'webpool':{'idle':4,'idletime':300,'warm':1}}|(ReadFile('resources/config.json',True) or {}))
+        self.configstore=ConfigStore('resources/config.json',500)
+        self.historywriter=HistoryWriter()
+        appdatabase.Migrate(['''
+            CREATE INDEX IF NOT EXISTS history_name_runtime ON history (name,runtime);
+            CREATE INDEX IF NOT EXISTS reports_tool_sendtime ON reports (tool,sendtime,filename);
+            CREATE TABLE usages (name NVARCHAR PRIMARY KEY NOT NULL,count INTEGER NOT NULL,runtime DATETIME NOT NULL);
+            CREATE INDEX usages_count_runtime ON usages (count DESC,runtime DESC);
+            CREATE INDEX usages_runtime ON usages (runtime DESC);
+            INSERT INTO usages SELECT name,COUNT(name),MAX(runtime) FROM history GROUP BY name;
+            CREATE TRIGGER history_insert AFTER INSERT ON history BEGIN
+                INSERT INTO usages VALUES (NEW.name,1,NEW.runtime) ON CONFLICT (name) DO UPDATE SET count=count+1,runtime=MAX(runtime,excluded.runtime);
+            END;
+            CREATE TRIGGER history_delete AFTER DELETE ON history BEGIN
+                UPDATE usages SET count=count-1,runtime=IFNULL((SELECT MAX(runtime) FROM history WHERE name=OLD.name),runtime) WHERE name=OLD.name;
+                DELETE FROM usages WHERE name=OLD.name AND count<1;
+            END;
+            CREATE TRIGGER history_update AFTER UPDATE OF name ON history BEGIN
+                UPDATE usages SET count=count-1,runtime=IFNULL((SELECT MAX(runtime) FROM history WHERE name=OLD.name),runtime) WHERE name=OLD.name;
+                DELETE FROM usages WHERE name=OLD.name AND count<1;
+                INSERT INTO usages VALUES (NEW.name,1,NEW.runtime) ON CONFLICT (name) DO UPDATE SET count=count+1,runtime=MAX(runtime,excluded.runtime);
+            END;
+            ''','''
+            CREATE TABLE docs (name NVARCHAR PRIMARY KEY NOT NULL,mtime REAL NOT NULL);
+            CREATE TABLE options (name NVARCHAR NOT NULL,flag NVARCHAR NOT NULL,aliases NVARCHAR NOT NULL,argument NVARCHAR NOT NULL,defaultvalue NVARCHAR NOT NULL,description NVARCHAR NOT NULL,examples NVARCHAR NOT NULL,PRIMARY KEY (name,flag));
+            ''','''
+            CREATE VIRTUAL TABLE fulltext USING fts5(name UNINDEXED,kind UNINDEXED,title,body,tokenize="unicode61 remove_diacritics 2");
+            DELETE FROM docs;
+            '''])
         self.icons={i:QIcon(f'resources/icons/{i}.png') for i in ['finished','pause','play','stopped','cmd','powershell','java','python','edge']}|{i:QIcon('resources/icons/java.png') for i in ['java8','java9+']}
+        self.lookups={}
         self.kinds=[list(i) for i in ReadDatabase('SELECT name,type FROM kinds')]
         self.movie=QMovie('resources/icons/running.gif')
         self.movie.frameChanged.connect(self.__movieframechanged)
@@ -545,7 +1244,17 @@ class MainWindow(QMainWindow):
         self.programkeys=['name','type','kind','prefix','path','file','output','format','icon','note','extra']
         self.programs=[{self.programkeys[j]:k or '' for j,k in enumerate(i)} for i in ReadDatabase('SELECT * FROM tools')]
         self.runninglist=[]
+        self.discovery=WindowDiscovery(Win32WindowProvider(),self.windowdiscovered.emit)
+        self.commandfinished.connect(self.__commandfinished)
+        self.windowdiscovered.connect(self.__windowdiscovered)
+        self.commands={}
+        self.dispatcher=CommandDispatcher(PostMessageTransport(),self.commandfinished.emit)
+        self.sampler=ProcessSampler(lambda:[i[1] for i in self.processlist])
+        self.sampler.signaler.connect(self.__processsampled)
+        self.scheduler=TickScheduler()
+        self.searcher=ToolSearcher(self.programs)
         self.searchkeywords=[False,'','']
+        self.snapshot=ProcessSnapshot()
         self.tools={i['name']:i for i in self.programs}
         self.setAcceptDrops(True)
         self.setAttribute(Qt.WidgetAttribute.WA_AlwaysShowToolTips,True)
@@ -579,68 +1288,100 @@ class MainWindow(QMainWindow):
         self.preview_window=PreviewWindow(self)
         self.anchors=[[8,self.tab_area]]
         self.movie.start()
+        self.configstore.start()
+        self.discovery.start()
+        self.dispatcher.start()
+        self.historywriter.start()
+        self.sampler.start()
+        QTimer.singleShot(0,appoptions.Rebuild)
+        QTimer.singleShot(0,lambda:appfulltext.Synchronize(self.programs))
+        self.scheduler.Add('process',self.sampler.Request,self.__processinterval,lambda:self.sampler.busy)
+        self.scheduler.Add('webpool',appwebpool.Evict,lambda:30000)
+        self.scheduler.Add('preview',self.__previewtick,self.__previewinterval)
         QTimer.singleShot(100,self.__createhome)
-        self.startTimer(1000)
         FileOperation('x','pyvenv.cfg','resources/pyvenv.cfg')
         # win32gui.SetProcessDPIAware()
     @AddWatcher
     def AppendUsing(self,name:str,ppid:int,cpid:int=0,hwnd:int=0)->None:
+        if not cpid:
+            self.DiscoverWindow(ppid,lambda i,j,k:j and self.AppendUsing(name,i,j),False)
+            return
         try:
-            if not cpid:
-                p=psutil.Process(ppid)
-                while not p.children():time.sleep(0.1)
-                cpid=p.children()[0].pid
             appconfig['residual'].append([name,ppid,cpid,hwnd])
             self.SaveConfig()
             self.processlist.append([name,ppid])
+            self.scheduler.Wake('process')
         except:pass
     @AddWatcher
+    def CancelDiscovery(self,lookup:int)->int:
+        self.lookups.pop(lookup,None)
+        return self.discovery.Cancel(lookup)
+    @AddWatcher
     def CheckProcess(self,name:str)->bool:
         t=self.tools[name]
         if t['type']=='url':return False
         n=t['name']
-        if any(i.topic.title==n for i in self.tab_area.SortedTabs()[1:]) or any(i[0].removeprefix('[内嵌] ').removeprefix('[待捕捉] ')==n for i in self.processlist):return True
+        if n in self.tab_area.titles or any(i[0].removeprefix('[内嵌] ').removeprefix('[待捕捉] ')==n for i in self.processlist):return True
         return False
     @AddWatcher
+    def DiscoverWindow(self,ppid:int,method:typing.Callable[[int,int,int],None],window:bool=True)->int:
+        self.lookups[i:=self.discovery.Find(ppid,window)]=method
+        return i
+    @AddWatcher
     def HomePage(self)->'HomeTopic':
-        return self.tab_area.SortedTabs()[0].topic
+        return self.tab_area.tabs[0].topic
     @AddWatcher
     def RefreshTools(self,name:str,config:dict)->None:
         for i in self.HomePage().favorite_group.children()+self.HomePage().history_group.children():
             if i.name==name:i.RefreshConfig(config)
     @AddWatcher
     def SaveConfig(self)->None:
-        WriteFile('resources/config.json',appconfig,True)
+        self.configstore.Save()
     @AddWatcher
     def SaveHistory(self,mode:int,*data:...)->None:
+        if mode==1:return self.historywriter.Submit(*data)
+        self.historywriter.Flush()
         WriteDatabase(['INSERT INTO history VALUES (?,?,?)','UPDATE history SET name=? WHERE name=?','DELETE FROM history WHERE name=?'][mode-1],*data)
     @AddWatcher
     def SaveKinds(self)->None:
-        WriteDatabase('DELETE FROM kinds')
-        WriteDatabaseMany('INSERT INTO kinds VALUES (?,?)',self.kinds)
+        with appdatabase:
+            WriteDatabase('DELETE FROM kinds')
+            WriteDatabaseMany('INSERT INTO kinds VALUES (?,?)',self.kinds)
     @AddWatcher
     def SaveTools(self,mode:int,tool:dict)->None:
-        match mode:
-            case 1:WriteDatabase(f'INSERT INTO tools VALUES ({','.join(['?']*len(self.programkeys))})',*[tool[i] or None for i in self.programkeys])
-            case 2:
-                WriteDatabase(f'UPDATE tools SET {','.join(f'{i}=?' for i in self.programkeys)} WHERE name=?',*[tool[i] or None for i in self.programkeys]+[tool['oldname']])
-                if tool['name']!=tool['oldname']:
-                    WriteDatabase('UPDATE reports SET tool=? WHERE tool=?',tool['name'],tool['oldname'])
-                    FileOperation('x',f'resources/docs/{tool['oldname']}.html',f'resources/docs/{tool['name']}.html')
-                    FileOperation('x',f'resources/shortcuts/{tool['oldname']}.ico',f'resources/shortcuts/{tool['name']}.ico')
-                    appconfig['favorite']=[tool['name'] if i==tool['oldname'] else i for i in appconfig['favorite']]
+        self.historywriter.Flush()
+        with appdatabase:
+            match mode:
+                case 1:WriteDatabase(f'INSERT INTO tools VALUES ({','.join(['?']*len(self.programkeys))})',*[tool[i] or None for i in self.programkeys])
+                case 2:
+                    WriteDatabase(f'UPDATE tools SET {','.join(f'{i}=?' for i in self.programkeys)} WHERE name=?',*[tool[i] or None for i in self.programkeys]+[tool['oldname']])
+                    if tool['name']!=tool['oldname']:
+                        WriteDatabase('UPDATE reports SET tool=? WHERE tool=?',tool['name'],tool['oldname'])
+                        FileOperation('x',f'resources/docs/{tool['oldname']}.html',f'resources/docs/{tool['name']}.html')
+                        FileOperation('x',f'resources/shortcuts/{tool['oldname']}.ico',f'resources/shortcuts/{tool['name']}.ico')
+                        appconfig['favorite']=[tool['name'] if i==tool['oldname'] else i for i in appconfig['favorite']]
+                        self.SaveConfig()
+                        self.SaveHistory(2,tool['name'],tool['oldname'])
+                case 3:
+                    WriteDatabase('DELETE FROM tools WHERE name=?',tool['name'])
+                    WriteDatabase('DELETE FROM reports WHERE tool=?',tool['name'])
+                    FileOperation('d',f'resources/docs/{tool['name']}.html')
+                    FileOperation('d',f'resources/shortcuts/{tool['name']}.ico')
+                    appconfig['favorite']=[i for i in appconfig['favorite'] if i!=tool['name']]
                     self.SaveConfig()
-                    self.SaveHistory(2,tool['name'],tool['oldname'])
-            case 3:
-                WriteDatabase('DELETE FROM tools WHERE name=?',tool['name'])
-                WriteDatabase('DELETE FROM reports WHERE tool=?',tool['name'])
-                FileOperation('d',f'resources/docs/{tool['name']}.html')
-                FileOperation('d',f'resources/shortcuts/{tool['name']}.ico')
-                appconfig['favorite']=[i for i in appconfig['favorite'] if i!=tool['name']]
-                self.SaveConfig()
-                self.SaveHistory(3,tool['name'])
+                    self.SaveHistory(3,tool['name'])
         self.programs=[{self.programkeys[j]:k or '' for j,k in enumerate(i)} for i in ReadDatabase('SELECT * FROM tools')]
         self.tools={i['name']:i for i in self.programs}
+        self.searcher.Update(tool.get('oldname',tool['name']),self.tools.get(tool['name']) if mode<3 else None)
+        appfulltext.Update(tool.get('oldname',tool['name']),'tool',None)
+        if mode<3:appfulltext.Update(tool['name'],'tool',self.tools[tool['name']]['note'])
+        for i in {tool.get('oldname',tool['name']),tool['name']}:appoptions.Options(i)
+    @AddWatcher
+    def SendCommand(self,hwnd:int,text:str,method:typing.Callable[[str],None]|None=None)->int:
+        i=self.dispatcher.Submit(hwnd,text)
+        if method:self.commands[i]=method
+        self.scheduler.Wake('process')
+        return i
     @AddWatcher
     def UseTool(self,name:str,augmented:bool)->None:
         t=self.tools[name]
@@ -652,17 +1393,14 @@ class MainWindow(QMainWindow):
                     if augmented:self.tab_area.AddTopic(EmbedCmdTopic(name),self.icons['stopped'])
                     else:
                         p=subprocess.Popen(c:=f'conhost cmd /k "cd /d {t['path']}"',creationflags=subprocess.CREATE_NEW_CONSOLE)
-                        w=FindWindow(p)
-                        for i in f'{r} {t['file']}':
-                            win32gui.PostMessage(w[2],win32con.WM_CHAR,ord(i),0)
-                            time.sleep(0.01)
-                        self.AppendUsing(name,*w[:2])
+                        self.DiscoverWindow(p.pid,lambda i,j,k:self.__consolefounded(name,f'{r} {t['file']}',i,j,k))
                 case 'ui':self.AppendUsing(name,subprocess.Popen(c:=f'cmd /c "cd /d {t['path']} && {r} {t['file']}"',creationflags=subprocess.CREATE_NO_WINDOW).pid)
                 case 'url':
                     try:subprocess.Popen([t['file'],c:=t['path']]) #webbrowser.get(t['file']).open_new_tab(c:=t['path'])
                     except:webbrowser.open(c:=t['path'])
-            if appconfig['history']['record']:self.SaveHistory(1,datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),name,c)
-            self.HomePage().RefreshHistory()
+            if appconfig['history']['record']:
+                self.SaveHistory(1,d:=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f'),name,c)
+                self.HomePage().BumpHistory(name,d)
         else:RequestMessage('w',self,'错误',f'工具“{name}”不存在')
     @AddWatcher
     def __createhome(self)->None:
@@ -688,7 +1426,7 @@ class MainWindow(QMainWindow):
             QApplication.clipboard().setMimeData(m)
     @AddWatcher
     def __shortcutctrlf(self)->None:
-        if (c:=self.__currentembedcmd()) and c.help_browser.isVisible():c.help_browser.WebFinderSwitch()
+        if (c:=self.__currentembedcmd()) and c.help_browser:c.help_browser.WebFinderSwitch()
     @AddWatcher
     def __shortcutctrlv(self)->None:
         if (c:=self.__currentembedcmd()) and isinstance(QApplication.focusWidget(),QListView) and (m:=QApplication.clipboard().mimeData()).hasUrls() and (n:=[i for i in (GetExistsFileName(i.toLocalFile()) for i in m.urls()) if i]):
@@ -737,7 +1475,7 @@ class MainWindow(QMainWindow):
             for i in self.HomePage().history_group.children():
                 if i.name==c.title:i.RefreshReports()
             # m=CreateControl(QPushButton,None,0,0,30,30,icon=c.model.itemFromIndex(d.selectedIndexes()[0]).icon())
-            # CreateAnimation(m,b'pos',d.viewport().mapTo(self,d.visualRect(d.selectedIndexes()[0]).topLeft()),self.tab_area.SortedTabs()[0].mapTo(self,QPoint(11,3)),CreateMirror(m,self))
+            # CreateAnimation(m,b'pos',d.viewport().mapTo(self,d.visualRect(d.selectedIndexes()[0]).topLeft()),self.tab_area.tabs[0].mapTo(self,QPoint(11,3)),CreateMirror(m,self))
             RequestMessage('i',self,'提示','已将结果文件发送到首页的历史记录中')
     @AddWatcher
     def __shortcutshiftdelete(self)->None:
@@ -747,6 +1485,55 @@ class MainWindow(QMainWindow):
                 RequestMessage('i',self,'提示','删除完成')
             except:RequestMessage('w',self,'警告','部分文件被占用，删除失败')
     @AddWatcher
+    def __processinterval(self)->int:
+        if self.runninglist or self.processdialog and self.processdialog.isVisible() and appconfig['process']['autorefresh']:return 1000
+        return 10000 if self.isMinimized() or not self.processlist else 3000
+    @AddWatcher
+    def __previewinterval(self)->int:
+        return 1000 if appconfig['general']['preview'] and self.preview_window.owner else 5000
+    @AddWatcher
+    def __previewtick(self)->None:
+        if appconfig['general']['preview']:self.preview_window.Refresh()
+    @AddWatcher
+    def __processsampled(self,snapshot:ProcessSnapshot)->None:
+        t=time.perf_counter()
+        self.sampler.busy=False
+        self.snapshot=snapshot
+        s={i.pid for i in snapshot.processes.values() if i.info['name'] in ('cmd.exe','conhost.exe')}
+        n=len(appconfig['residual'])
+        appconfig['residual']=[i for i in appconfig['residual'] if i[1] in s]
+        if len(appconfig['residual'])!=n:self.SaveConfig()
+        self.processlist=[i for i in self.processlist if i[1] in s]
+        self.pausedtool=False
+        self.runninglist.clear()
+        for i in self.tab_area.tabs[1:]:
+            if isinstance(i.topic,EmbedCmdTopic):
+                p=i.topic.GetProcessList()
+                try:
+                    if p[0].info['status']==psutil.STATUS_RUNNING:
+                        self.runninglist.append(i)
+                        ChangeIcon(i.topic.pause_resume,self.icons['pause'])
+                    else:
+                        self.pausedtool=True
+                        i.tab_title.setIcon(self.icons['pause'])
+                        ChangeIcon(i.topic.pause_resume,self.icons['play'])
+                except:
+                    i.tab_title.setIcon(self.icons['stopped' if p is None else 'finished'])
+                    ChangeIcon(i.topic.pause_resume,self.icons['stopped'])
+        if self.processdialog and appconfig['process']['autorefresh']:self.processdialog.RefreshTree()
+        self.scheduler.Report('process',snapshot.cost+(time.perf_counter()-t)*1000)
+    @AddWatcher
+    def __consolefounded(self,name:str,command:str,ppid:int,cpid:int,hwnd:int)->None:
+        if hwnd:self.SendCommand(hwnd,command,lambda i:i=='failed' and RequestMessage('w',self,'警告',f'工具“{name}”的启动命令发送失败，控制台窗口未响应'))
+        if cpid:self.AppendUsing(name,ppid,cpid)
+    @AddWatcher
+    def __commandfinished(self,job:int,state:str)->None:
+        if state=='sent':self.scheduler.Wake('process')
+        if m:=self.commands.pop(job,None):m(state)
+    @AddWatcher
+    def __windowdiscovered(self,lookup:int,ppid:int,cpid:int,hwnd:int)->None:
+        if m:=self.lookups.pop(lookup,None):m(ppid,cpid,hwnd)
+    @AddWatcher
     def __movieframechanged(self,event:int)->None:
         n=QIcon(self.movie.currentPixmap())
         for i in self.runninglist:i.tab_title.setIcon(n)
@@ -761,6 +1548,7 @@ class MainWindow(QMainWindow):
             b=FindControlAtPosition(self.tool_menu,QPoint(),QPushButton)
             if RequestMessage('q',self,'提示',f'是否将工具“{t.name}”的结果文件“{b.toolTip()}”从首页移除？',QMessageBox.StandardButton.Yes|QMessageBox.StandardButton.No,QMessageBox.StandardButton.No)==QMessageBox.StandardButton.Yes:
                 WriteDatabase('DELETE FROM reports WHERE tool=? AND filename=?',t.name,b.toolTip())
+                t.reports.remove(b.toolTip())
                 c=t.reports_area.children()
                 CreateAnimationsByParallel(self,[CreateAnimation(i,b'pos',i.pos(),i.pos()-QPoint(40,0)) for i in c[c.index(b)+1:]])
                 CloseControl(b)
@@ -784,15 +1572,28 @@ class MainWindow(QMainWindow):
             self.HomePage().RefreshFavorite()
             if w is self:CreateAnimation(h.favorite_group.children()[-1],b'pos',t.mapTo(h,QPoint()),h.favorite_group.mapTo(h,QPoint(10,15)),CreateMirror(h.favorite_group.children()[-1],h),True)
     @AddWatcher
+    def changeEvent(self,event:QEvent)->None:
+        if event.type()==QEvent.Type.WindowStateChange and not self.isMinimized():self.scheduler.Wake('process')
+        return super().changeEvent(event)
+    @AddWatcher
     def closeEvent(self,event:QCloseEvent)->None:
-        if self.pausedtool or self.runninglist:
+        self.snapshot=ProcessSnapshot()
+        if any(isinstance(i.topic,EmbedCmdTopic) and i.topic.GetProcessList() for i in self.tab_area.tabs[1:]):
             match RequestMessage('q',self,'提示','有正在执行的任务，是否释放对应的窗口？\n└是：将正在运行的窗口释放回桌面；\n└否：直接关闭所有窗口；\n└取消：不进行任何操作。',QMessageBox.StandardButton.Yes|QMessageBox.StandardButton.No|QMessageBox.StandardButton.Cancel,QMessageBox.StandardButton.Cancel):
                 case QMessageBox.StandardButton.Yes:self.tab_area.CleanUp(2)
                 case QMessageBox.StandardButton.No:self.tab_area.CleanUp(3)
                 case QMessageBox.StandardButton.Cancel:return event.ignore()
         else:self.tab_area.CleanUp(3)
         if self.processdialog:self.processdialog.close()
+        self.scheduler.timer.stop()
+        self.configstore.Stop()
+        self.discovery.Stop()
+        self.dispatcher.Stop()
+        self.historywriter.Stop()
+        self.sampler.Stop()
+        appwebpool.Close()
         WriteDatabase('VACUUM')
+        appdatabase.Close()
         FileOperation('x','resources/pyvenv.cfg','pyvenv.cfg')
         return super().closeEvent(event)
     @AddWatcher
@@ -811,37 +1612,13 @@ class MainWindow(QMainWindow):
         Reshape(self,event)
         self.tab_area.ArrangeTabs(True)
         return super().resizeEvent(event)
-    @AddWatcher
-    def timerEvent(self,event:QTimerEvent)->None:
-        s=[i.pid for i in psutil.process_iter(['pid','name']) if i.name() in ('cmd.exe','conhost.exe')]
-        n=len(appconfig['residual'])
-        appconfig['residual']=[i for i in appconfig['residual'] if i[1] in s]
-        if len(appconfig['residual'])!=n:self.SaveConfig()
-        self.processlist=[i for i in self.processlist if i[1] in s]
-        self.pausedtool=False
-        self.runninglist.clear()
-        for i in self.tab_area.SortedTabs()[1:]:
-            if isinstance(i.topic,EmbedCmdTopic):
-                p=i.topic.GetProcessList()
-                try:
-                    if p[0].status()==psutil.STATUS_RUNNING:
-                        self.runninglist.append(i)
-                        ChangeIcon(i.topic.pause_resume,self.icons['pause'])
-                    else:
-                        self.pausedtool=True
-                        i.tab_title.setIcon(self.icons['pause'])
-                        ChangeIcon(i.topic.pause_resume,self.icons['play'])
-                except:
-                    i.tab_title.setIcon(self.icons['stopped' if i.topic.GetProcessList() is None else 'finished'])
-                    ChangeIcon(i.topic.pause_resume,self.icons['stopped'])
-        if appconfig['general']['preview']:self.preview_window.Refresh()
-        return super().timerEvent(event)
 
 class PreviewWindow(QLabel):
     @AddWatcher
     def __init__(self,parent:QWidget)->None:
         super().__init__(parent)
         self.owner=None
+        self.pipeline=PreviewPipeline(self.__render)
         self.position=QPoint()
         self.previewwidth=0
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents,True)
@@ -853,14 +1630,14 @@ class PreviewWindow(QLabel):
     def Refresh(self)->None:
         if self.owner:
             c=self.owner.GrabCommand() if appconfig['general']['preview']==2 else []
-            w=self.owner.GrabWindow()
+            w,u=self.pipeline.Process(self.owner.GrabWindow(self.previewwidth),self.previewwidth)
             h=len(c)*15
-            a,b=self.previewwidth+6,self.previewwidth*w.height()//w.width()+h+6
+            a,b=self.previewwidth+6,w.height()+h+6
             self.setGeometry(max(min(self.position.x(),mainwindow.width()-a-5),5),max(min(self.position.y(),mainwindow.height()-b-5),5),a,b)
             self.preview_command.resize(self.previewwidth,h)
             self.preview_command.setText('\n'.join(c))
             self.preview_window.setGeometry(3,h+2,a-6,b-h-6)
-            self.preview_window.setPixmap(PixmapTranslucent(w.scaled(self.previewwidth,self.previewwidth*w.height()//w.width(),mode=Qt.TransformationMode.SmoothTransformation),224))
+            if u:self.preview_window.setPixmap(w)
         elif self.width():
             self.setGeometry(-1,-1,1,1)
             self.setPixmap(QPixmap())
@@ -870,6 +1647,11 @@ class PreviewWindow(QLabel):
         self.position=position
         self.previewwidth=appconfig['general']['preview']*300
         self.Refresh()
+        if owner:mainwindow.scheduler.Wake('preview')
+    @AddWatcher
+    def __render(self,image:QImage,width:int,height:int)->QPixmap:
+        if (image.width(),image.height())!=(width,height):image=image.scaled(width,height,mode=Qt.TransformationMode.SmoothTransformation)
+        return PixmapTranslucent(QPixmap.fromImage(image),224)
 
 class TopicBase(QFrame):
     @AddWatcher
@@ -888,7 +1670,10 @@ class TabArea(QWidget):
         self.current=-1
         self.history=[]
         self.pen=QPen(Qt.GlobalColor.gray,1,Qt.PenStyle.SolidLine)
+        self.ppids={}
         self.static=False
+        self.tabs=[]
+        self.titles={}
         self.setGeometry(10,10,width,height)
         self.tab_canvas=QWidget()
         self.tab_canvas.dropEvent=self.__tab_canvas_drop
@@ -904,16 +1689,18 @@ class TabArea(QWidget):
         self.anchors=[[6,self.tab_scroll],[8,self.topic_area]]
     @AddWatcher
     def AddTopic(self,topic:TopicBase,icon:QIcon|None=None)->None:
-        self.SwitchTab(t:=TabItem(self,topic,icon))
+        t=TabItem(self,topic,icon)
+        self.tabs.insert(self.tabs.index(self.history[-1])+1 if self.history else len(self.tabs),t)
+        self.Reindex()
+        self.SwitchTab(t)
         self.ArrangeTabs(True)
         topic.resize(self.width(),self.height()-40)
-        if len(self.tab_canvas.children())>1:t.tab_title.installEventFilter(self)
+        if len(self.tabs)>1:t.tab_title.installEventFilter(self)
     @AddWatcher
     def ArrangeTabs(self,withanimation:bool)->None:
         n=0
-        t=self.SortedTabs()
         a=[]
-        for i,j in enumerate(t):
+        for i,j in enumerate(self.tabs):
             j.SetTabTitle(j.topic.title,i)
             if withanimation:a.append(CreateAnimation(j,b'pos',j.pos(),QPoint(n,0)))
             else:j.move(n,0)
@@ -924,28 +1711,34 @@ class TabArea(QWidget):
         else:self.__keepinviewport()
     @AddWatcher
     def CleanUp(self,cleancode:int)->None:
-        for i in self.SortedTabs()[1:]:i.topic.CleanUp(cleancode)
+        for i in self.tabs[1:]:i.topic.CleanUp(cleancode)
     @AddWatcher
     def CurrentTab(self)->'TabItem|None':
-        return self.SortedTabs()[self.current] if self.current>-1 else None
+        return self.tabs[self.current] if self.current>-1 else None
+    @AddWatcher
+    def Reindex(self)->None:
+        self.ppids={i.topic.ppid:i for i in self.tabs[1:] if isinstance(i.topic,EmbedCmdTopic)}
+        self.titles={i.topic.title:i for i in self.tabs[1:]}
     @AddWatcher
     def RemoveTab(self,tab:'TabItem')->None:
         if tab.topic.CleanUp(1):
             if tab in self.history:self.history.remove(tab)
             mainwindow.runninglist=[i for i in mainwindow.runninglist if i is not tab]
+            self.tabs.remove(tab)
+            self.Reindex()
             CloseControl(tab)
             CloseControl(tab.topic)
             self.SwitchTab(self.history[-1])
             self.ArrangeTabs(True)
     @AddWatcher
     def SwitchIndex(self,index:int=-2)->None:
-        if index>-2:self.SwitchTab(self.SortedTabs()[index] if index>-1 else None)
+        if index>-2:self.SwitchTab(self.tabs[index] if index>-1 else None)
         else:self.repaint()
     @AddWatcher
     def SwitchTab(self,tab:'TabItem|None'=None)->None:
         if tab:
-            self.current=self.SortedTabs().index(tab)
-            for i in self.tab_canvas.children():MoveControl(i.topic,self.topic_area if i is tab else self.hide_window)
+            self.current=self.tabs.index(tab)
+            for i in self.tabs:MoveControl(i.topic,self.topic_area if i is tab else self.hide_window)
             if tab in self.history:self.history.remove(tab)
             self.history.append(tab)
             self.__keepinviewport()
@@ -953,9 +1746,6 @@ class TabArea(QWidget):
             self.current=-1
             self.repaint()
     @AddWatcher
-    def SortedTabs(self)->list['TabItem']:
-        return sorted(self.tab_canvas.children(),key=lambda i:i.x()+i.width()/2+isinstance(i.topic,EmbedCmdTopic)*1000)
-    @AddWatcher
     def __keepinviewport(self)->None:
         if self.current>-1:self.tab_scroll.ensureWidgetVisible(self.CurrentTab(),xmargin=20)
         self.repaint()
@@ -965,15 +1755,14 @@ class TabArea(QWidget):
     @AddWatcher
     def __tab_canvas_drop(self,event:QDropEvent)->None:
         if isinstance(s:=event.source(),TabItem):
-            t=self.SortedTabs()
-            c=t[self.current]
-            p={i:i.x() for i in t}
+            c=self.tabs[self.current]
+            p={i:i.x() for i in self.tabs}
             s.move(event.position().x()-s.width()//2,0)
+            self.tabs.sort(key=lambda i:i.x()+i.width()/2+isinstance(i.topic,EmbedCmdTopic)*1000)
             self.SwitchTab(c)
             self.ArrangeTabs(False)
-            t=self.SortedTabs()
-            q={i:i.x() for i in t}
-            CreateAnimationsByParallel(self,[CreateAnimation(i,b'pos',QPoint(event.position().x()-s.width()//2 if i is s else p[i],0),QPoint(q[i],0)) for i in t[1:]],self.__keepinviewport)
+            q={i:i.x() for i in self.tabs}
+            CreateAnimationsByParallel(self,[CreateAnimation(i,b'pos',QPoint(event.position().x()-s.width()//2 if i is s else p[i],0),QPoint(q[i],0)) for i in self.tabs[1:]],self.__keepinviewport)
     @AddWatcher
     def eventFilter(self,watched:QObject,event:QEvent)->None:
         match event.type():
@@ -988,7 +1777,7 @@ class TabArea(QWidget):
     @AddWatcher
     def paintEvent(self,event:QPaintEvent)->None:
         w,h=self.width(),self.height()
-        t=self.SortedTabs()
+        t=self.tabs
         p=QPainter()
         p.begin(self)
         p.setPen(self.pen)
@@ -1004,12 +1793,12 @@ class TabArea(QWidget):
     @AddWatcher
     def resizeEvent(self,event:QResizeEvent)->None:
         Reshape(self,event)
-        for i in self.SortedTabs():i.topic.resize(self.width(),self.height()-40)
+        for i in self.tabs:i.topic.resize(self.width(),self.height()-40)
         self.__keepinviewport()
         return super().resizeEvent(event)
     @AddWatcher
     def wheelEvent(self,event:QWheelEvent)->None:
-        if event.position().y()<40 and (n:=len(self.SortedTabs())) and (d:=event.angleDelta().y()):self.SwitchIndex(max(min(self.current-d//abs(d),n-1),0))
+        if event.position().y()<40 and (n:=len(self.tabs)) and (d:=event.angleDelta().y()):self.SwitchIndex(max(min(self.current-d//abs(d),n-1),0))
         return super().wheelEvent(event)
 
 class TabItem(QWidget):
@@ -1065,7 +1854,7 @@ class HomeTopic(TopicBase):
     def __init__(self)->None:
         super().__init__('首页')
         self.static=False
-        CreateControl(QWebEngineView,self,11,11,1,1)
+        QTimer.singleShot(0,appwebpool.Warm)
         CreateControl(QPushButton,self,10,10,90,30,'工具管理',self.__tools_manager)
         CreateControl(QPushButton,self,110,10,90,30,'进程管理',self.__process_manager)
         CreateControl(QPushButton,self,210,10,90,30,'系统配置',self.__set_config)
@@ -1083,6 +1872,10 @@ class HomeTopic(TopicBase):
         self.RefreshFavorite()
         self.RefreshHistory()
     @AddWatcher
+    def ArrangeHistory(self)->None:
+        p=sorted(self.history_group.children(),key=lambda i:(i.count,i.lastaccess) if appconfig['history']['orderbycount'] else i.lastaccess,reverse=True)
+        CreateAnimationsByParallel(self,[CreateAnimation(j,b'pos',j.pos(),QPoint(8,i*40+13)) for i,j in enumerate(p)])
+    @AddWatcher
     def ArrangeItems(self,kind:int=3)->None:
         n=(self.width()-50)//210
         if kind&1:
@@ -1097,31 +1890,38 @@ class HomeTopic(TopicBase):
             CreateAnimationsByParallel(self,[CreateAnimation(j,b'pos',j.pos(),QPoint(8,i*40+13)) for i,j in enumerate(c)])
         self.content_canvas.resize(self.width()-40,self.favorite_group.height()+self.history_group.height()+10)
     @AddWatcher
+    def BumpHistory(self,name:str,lastaccess:str)->None:
+        if not (f:=next((i for i in self.history_group.children() if i.name==name),None)):return self.RefreshHistory()
+        f.RefreshDetail(f.count+1,lastaccess)
+        self.ArrangeHistory()
+    @AddWatcher
     def RefreshFavorite(self)->None:
         c=(self.width()-50)//210
         p=self.favorite_group.children()
         q=appconfig['favorite'][::-1]
         m=[i.name for i in p]
         for i in (i for i in p if i.name not in q):CloseControl(i)
-        for i in (i for i in q if i not in m):any(i.installEventFilter(self) for i in ToolItem(self.favorite_group,i).findChildren(QPushButton,options=Qt.FindChildOption.FindDirectChildrenOnly))
+        for i in (i for i in q if i not in m):any(i.installEventFilter(self) for i in ToolItem(self.favorite_group,i).buttons if not i.isHidden())
         self.favorite_group.resize(self.width()-40,(len(q)+c-1)//c*40+15)
         CreateAnimationsByParallel(self,[CreateAnimation(i,b'pos',i.pos(),QPoint(q.index(i.name)%c*210+8,q.index(i.name)//c*40+13)) for i in self.favorite_group.children()])
         self.history_group.move(0,self.favorite_group.height()+10)
         self.content_canvas.resize(self.width()-40,self.favorite_group.height()+self.history_group.height()+10)
     @AddWatcher
     def RefreshHistory(self)->None:
+        mainwindow.historywriter.Flush()
         p=self.history_group.children()
-        q=ReadDatabase(f'SELECT name,COUNT(name) c,MAX(runtime) t FROM history GROUP BY name ORDER BY {'c DESC,'*appconfig['history']['orderbycount']}t DESC')[:appconfig['history']['maxshown']]
+        q=ReadDatabase(f'SELECT name,count c,runtime t FROM usages ORDER BY {'c DESC,'*appconfig['history']['orderbycount']}t DESC LIMIT ?',appconfig['history']['maxshown'])
         m=[i.name for i in p]
         n=[i[0] for i in q]
         a=[]
+        r=ReadReports(n)
         for i in (i for i in p if i.name not in n):CloseControl(i)
         for i in (i for i in q if i[0] not in m):HistoryFrame(self,*i)
         self.history_group.resize(self.width()-40,len(q)*40+15)
         for i in self.history_group.children():
             t=n.index(i.name)
             i.RefreshDetail(*q[t][1:])
-            i.RefreshReports()
+            i.RefreshReports(r[i.name])
             a.append(CreateAnimation(i,b'pos',i.pos(),QPoint(8,t*40+13)))
         self.content_canvas.resize(self.width()-40,self.favorite_group.height()+self.history_group.height()+10)
         CreateAnimationsByParallel(self,a)
@@ -1138,6 +1938,7 @@ class HomeTopic(TopicBase):
     @AddWatcher
     def __process_manager(self)->None:
         if not mainwindow.processdialog:mainwindow.processdialog=ProcessDialog()
+        mainwindow.scheduler.Wake('process')
         if mainwindow.processdialog.isMaximized():mainwindow.processdialog.showMaximized()
         else:mainwindow.processdialog.showNormal()
         mainwindow.processdialog.activateWindow()
@@ -1179,17 +1980,21 @@ class HistoryFrame(QFrame):
     def __init__(self,owner:HomeTopic,name:str,count:int,lastaccess:str)->None:
         super().__init__(owner.history_group)
         w=owner.width()
+        self.count=count
+        self.lastaccess=lastaccess
         self.name=name
         self.owner=owner
+        self.reports=[]
         self.resize(w-58,34)
         self.setStyleSheet('HistoryFrame:hover{background-color:gray}')
         self.tool_item=ToolItem(self,name)
         if mainwindow.tools[name]['type']!='url':self.add_reports=CreateControl(QPushButton,self,250,2,90,30,'添加结果文件',self.__add_reports)
         self.reports_area=CreateControl(QWidget,self,390,2,400,30)
+        self.more_reports=CreateControl(QLabel,self.reports_area,360,0,40,30,'···')
+        self.more_reports.hide()
         self.use_count=CreateControl(QLabel,self,w-350,2,100,30,f'已使用 {count} 次')
         self.use_time=CreateControl(QLabel,self,w-240,2,185,30,f'最近使用：{lastaccess[:19]}')
         self.anchors=[[3,self.use_count,self.use_time]]
-        self.RefreshReports()
         self.show()
     @AddWatcher
     def RefreshConfig(self,config:dict)->None:
@@ -1197,14 +2002,21 @@ class HistoryFrame(QFrame):
         self.tool_item.RefreshConfig(config)
     @AddWatcher
     def RefreshDetail(self,count:int,lastaccess:str)->None:
+        self.count=count
+        self.lastaccess=lastaccess
         self.use_count.setText(f'已使用 {count} 次')
         self.use_time.setText(f'最近使用：{lastaccess[:19]}')
     @AddWatcher
-    def RefreshReports(self)->None:
-        n=ReadDatabase('SELECT filename FROM reports WHERE tool=? ORDER BY sendtime',self.name)[:-10:-1]
-        for i in self.reports_area.children():CloseControl(i)
-        for i,j in enumerate(n[:9]):CreateControl(QPushButton,self.reports_area,i*40,0,30,30,'',self.__buttons,j[0],GetFileIcon(j[0])).contextMenuEvent=self.__buttonscontextmenu
-        if len(n)>9:CreateControl(QLabel,self.reports_area,360,0,40,30,'···')
+    def RefreshReports(self,reports:list[str]|None=None)->None:
+        n=[i[0] for i in ReadDatabase('SELECT filename FROM reports WHERE tool=? ORDER BY sendtime DESC LIMIT 10',self.name)] if reports is None else reports
+        if n==self.reports:return
+        b=self.reports_area.findChildren(QPushButton,options=Qt.FindChildOption.FindDirectChildrenOnly)
+        for i,j in enumerate(n[:9]):
+            if i>=len(b):CreateControl(QPushButton,self.reports_area,i*40,0,30,30,'',self.__buttons,j,GetFileIcon(j)).contextMenuEvent=self.__buttonscontextmenu
+            elif b[i].toolTip()!=j:ChangeIcon(b[i],GetFileIcon(j)).setToolTip(j)
+        for i in b[min(len(n),9):]:CloseControl(i)
+        self.more_reports.setVisible(len(n)>9)
+        self.reports=n
     @AddWatcher
     def __buttons(self)->None:
         s=self.sender()
@@ -1213,6 +2025,7 @@ class HistoryFrame(QFrame):
         if pathlib.Path(f'{mainwindow.tools[self.name]['path']}/{t}').is_file():QDesktopServices.openUrl(QUrl(f'file:///{apppath}/{mainwindow.tools[self.name]['path']}/{t}'))
         else:
             WriteDatabase('DELETE FROM reports WHERE tool=? AND filename=?',self.name,t)
+            self.reports.remove(t)
             c=self.reports_area.children()
             CreateAnimationsByParallel(self,[CreateAnimation(i,b'pos',i.pos(),i.pos()-QPoint(40,0)) for i in c[c.index(s)+1:]])
             CloseControl(s)
@@ -1239,8 +2052,9 @@ class ToolsPanel(QDialog):
     @AddWatcher
     def __init__(self)->None:
         super().__init__(mainwindow,Qt.WindowType.WindowCloseButtonHint|Qt.WindowType.WindowMaximizeButtonHint)
-        self.htmlhead='<style>button{font-size:12px;margin:0px;padding:0px;vertical-align:middle;width:200px;height:30px;}.large{width:170px;}.small{width:30px;}button img{display:inline-block;width:15px;height:15px;}pre{white-space:pre-wrap;word-wrap:break-word;}</style>'
-        self.htmltail='document.querySelectorAll("button").forEach((i)=>{i.addEventListener("click",()=>{webchannel.Method([i.offsetWidth>100,i.name]);})})'
+        self.pageloaded=False
+        self.pageversion=mainwindow.searcher.version
+        self.results=[]
         self.title='工具列表'
         self.setAttribute(Qt.WidgetAttribute.WA_AlwaysShowToolTips,True)
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose,True)
@@ -1249,6 +2063,9 @@ class ToolsPanel(QDialog):
         self.setWindowTitle('工具列表')
         QShortcut(QKeySequence('Ctrl+F'),self).activated.connect(self.__shortcutctrlf)
         self.buttongroups=[]
+        self.highlights=set()
+        self.items={}
+        self.pool=[]
         CreateControl(QPushButton,self,10,10,100,30,'切换检索模式',self.__switch_search)
         CreateControl(QPushButton,self,130,10,80,30,'工具名称',icon=mainwindow.icons['cmd'])
         CreateControl(QLabel,self,210,10,90,30,'启动内嵌cmd窗口')
@@ -1266,38 +2083,99 @@ class ToolsPanel(QDialog):
         self.found_count.setAlignment(Qt.AlignmentFlag.AlignRight)
         self.found_count.setStyleSheet('padding-top:9px;padding-right:2px;')
         self.hidden_board=CreateControl(QWidget,self,10,10,1,1)
-        self.boards=[CreateControl(QWidget,self,0,50,890,540),CreateControl(QWidget,self.hidden_board,0,50,890,540)]
+        self.boards=[CreateControl(QWidget,self,0,50,890,540),CreateControl(QWidget,self.hidden_board,0,50,890,540),CreateControl(QWidget,self.hidden_board,0,50,890,540)]
+        self.mode=0
         self.content_canvas=QWidget()
         self.content_scroll=CreateControl(QScrollArea,self.boards[0],5,0,875,540)
         self.content_scroll.setWidget(self.content_canvas)
+        self.content_scroll.verticalScrollBar().valueChanged.connect(self.__content_scroll_valuechanged)
         self.buttongroups=[self.__creategroup(i[0]) for i in mainwindow.kinds]
-        self.tools_browser=WebArea(self.boards[1],10,0,870,540,f'<h2>请输入条件检索</h2><script>{mainwindow.htmlroot}</script>',self.__js_method_called,lambda:self.search_tools.setFocus())
-        self.tools_browser.loadFinished.connect(self.__browserloaded)
-        self.anchors=[[3,self.show_unmatched,self.search_tools,self.found_count],[8,self.content_scroll,self.tools_browser]+self.boards]
+        self.searchtimer=QTimer(self)
+        self.searchtimer.setInterval(150)
+        self.searchtimer.setSingleShot(True)
+        self.searchtimer.timeout.connect(self.__search)
+        appassets.Register('tools',self.__createpage)
+        self.tools_browser=appwebpool.Acquire(f'toolbox:/tools?{self.pageversion}',self.boards[1],10,0,870,540,self.__js_method_called,lambda:self.search_tools.setFocus(),self.__browserloaded)
+        self.tools_browser.show()
+        self.pageloaded=self.tools_browser.loaded
+        self.fulltext_list=CreateControl(QListWidget,self.boards[2],10,0,870,540)
+        self.fulltext_list.setWordWrap(True)
+        self.fulltext_list.itemDoubleClicked.connect(self.__fulltext_list_doubleclicked)
+        self.anchors=[[3,self.show_unmatched,self.search_tools,self.found_count],[8,self.content_scroll,self.tools_browser,self.fulltext_list]+self.boards]
         self.search_tools.setFocus()
         self.__search()
     @AddWatcher
     def ArrangeGroups(self)->None:
         t=5
         n=(self.width()-50)//210
-        a=[]
         for i in self.buttongroups:
-            c=[j for j in i.children() if j.matched]
-            i.setGeometry(5,t,self.width()-40,(len(c)+n-1)//n*40+15)
-            for j,k in enumerate(c):a.append(CreateAnimation(k,b'pos',k.pos(),QPoint(j%n*210+8,j//n*40+13)))
+            i.setGeometry(5,t,self.width()-40,(len(i.matched)+n-1)//n*40+15)
             t+=i.height()+5
-        CreateAnimationsByParallel(self,a)
         self.content_canvas.resize(self.width()-35,t-5)
+        self.RecycleItems(True)
     @AddWatcher
     def CreateButtons(self,config:dict)->str:
         n=GetButtonIconName(config)
         return f'<button class="large" name="{config['name']}"><img src="{n}">{config['name']}</button><button class="small" name="{config['name']}"><img src="{n}"></button>' if config['type']=='cmd' else f'<button name="{config['name']}"><img src="{n}">{config['name']}</button>'
     @AddWatcher
+    def RecycleItems(self,animated:bool=False)->None:
+        n=max((self.width()-50)//210,1)
+        y=self.content_scroll.verticalScrollBar().value()
+        h=self.content_scroll.viewport().height()
+        v={}
+        a=[]
+        for i in self.buttongroups:
+            for j in range(max((y-i.y()-13)//40,0),min((y+h-i.y()-13)//40+1,(len(i.matched)+n-1)//n)):
+                for k in range(j*n,min(j*n+n,len(i.matched))):v[i.matched[k]]=QPoint(k%n*210+13,i.y()+j*40+13)
+        for i in [i for i in self.items if i not in v]:
+            self.items[i].hide()
+            self.pool.append(self.items.pop(i))
+        for i,j in v.items():
+            if i in self.items:
+                if (k:=self.items[i]).pos()!=j:
+                    if animated:a.append(CreateAnimation(k,b'pos',k.pos(),j))
+                    else:k.move(j)
+            else:
+                if self.pool:(k:=self.pool.pop()).RefreshConfig(mainwindow.tools[i])
+                else:k=ToolItem(self.content_canvas,i,self)
+                k.move(j)
+                k.show()
+                self.items[i]=k
+            k.border_frame.setVisible(i in self.highlights)
+        if a:CreateAnimationsByParallel(self,a)
+    @AddWatcher
     def RefreshTools(self,name:str,config:dict)->None:
-        any(i.RefreshConfig(config) for j in self.buttongroups for i in j.children() if i.name==name)
+        for i in self.buttongroups:i.names=[config['name'] if j==name else j for j in i.names]
+        if name in self.items:
+            self.items[config['name']]=self.items.pop(name)
+            self.items[config['name']].RefreshConfig(config)
         self.__search()
     @AddWatcher
-    def __browserloaded(self,event:bool)->None:
+    def done(self,result:int)->None:
+        if self.tools_browser:
+            self.anchors[1].remove(self.tools_browser)
+            appwebpool.Release(self.tools_browser)
+            self.tools_browser=None
+        appassets.Register('tools',None)
+        return super().done(result)
+    @AddWatcher
+    def __browserloaded(self)->None:
+        self.pageloaded=True
+        self.__filterpage()
+    @AddWatcher
+    def __createpage(self)->str:
+        h=appassets.Wrap('tools',f'<h2 id="empty"></h2><div id="list">{''.join(f'<div>{self.CreateButtons(i)}{f'<pre>{i['note']}</pre>'}<hr></div>' for i in mainwindow.programs)}</div>')
+        appiconfiles.Save()
+        return h
+    @AddWatcher
+    def __filterpage(self)->None:
+        s=self.search_tools.text()
+        n={j['name']:i for i,j in enumerate(mainwindow.programs)}
+        t=list(range(len(n))) if self.show_unmatched.isChecked() else [n[i] for i in self.results]
+        self.tools_browser.page().runJavaScript(f'Filter({json.dumps(t)},{json.dumps('' if t else '无匹配项，请修改关键字' if s else '请输入关键字检索',ensure_ascii=False)})',0,self.__pagefiltered)
+    @AddWatcher
+    def __pagefiltered(self,result:typing.Any)->None:
+        if not self.tools_browser:return
         self.tools_browser.find_area.show()
         self.tools_browser.find_text.setText(self.search_tools.text())
         self.tools_browser.find_next.click()
@@ -1305,7 +2183,8 @@ class ToolsPanel(QDialog):
     def __creategroup(self,kind:str)->QGroupBox:
         g=CreateControl(QGroupBox,self.content_canvas,0,0,0,0)
         g.setTitle(kind.replace('&','&&'))
-        for i in (i for i in mainwindow.programs if i['kind']==kind):ToolItem(g,i['name'],self)
+        g.names=[i['name'] for i in mainwindow.programs if i['kind']==kind]
+        g.matched=g.names
         return g
     @AddWatcher
     def __shortcutctrlf(self)->None:
@@ -1315,32 +2194,54 @@ class ToolsPanel(QDialog):
         s=self.search_tools.text()
         a=self.show_unmatched.isChecked()
         b=bool(s)
-        for i in (i for j in self.buttongroups for i in j.children()):
-            c=s.lower() in i.target
-            i.matched=(a or c)
-            i.setVisible(a or c)
-            i.border_frame.setVisible(b and c)
+        r=mainwindow.searcher.Search(s)
+        m=set(r)
+        self.highlights=m if b else set()
+        self.results=r
+        for i in self.buttongroups:i.matched=[j for j in i.names if a or not b or j in m]
         mainwindow.searchkeywords[1]=s
         self.ArrangeGroups()
-        t=[i for i in mainwindow.programs if s.lower() in f'{i['name']}\n{i['note']}'.lower()] if s else []
-        self.found_count.setText(str(len(t)) if s else '')
-        if self.show_unmatched.isChecked():t=mainwindow.programs
-        self.tools_browser.setHtml(f'{self.htmlhead}{''.join(f'{self.CreateButtons(i)}{f'<pre>{i['note']}</pre>'}<hr>' for i in t)}<script>{mainwindow.htmlroot}{self.htmltail}</script>' if t else f'<h2>无匹配项，请修改关键字</h2><script>{mainwindow.htmlroot}</script>' if s else f'<h2>请输入关键字检索</h2><script>{mainwindow.htmlroot}</script>',QUrl(apppath))
+        self.found_count.setText(str(len(r)) if s else '')
+        if self.pageversion!=mainwindow.searcher.version:
+            self.pageloaded=False
+            self.pageversion=mainwindow.searcher.version
+            self.tools_browser.Load(f'toolbox:/tools?{self.pageversion}')
+        elif self.pageloaded:self.__filterpage()
+        if self.mode==2:self.__fulltext()
+    @AddWatcher
+    def __fulltext(self)->None:
+        self.fulltext_list.clear()
+        for i,j,k in (r:=appfulltext.Search(self.search_tools.text())):
+            (n:=QListWidgetItem(f'{i}［{'文档' if j=='doc' else '描述'}］\n{' '.join(k.split())}')).setData(Qt.ItemDataRole.UserRole,i)
+            self.fulltext_list.addItem(n)
+        self.found_count.setText(str(len(r)) if self.search_tools.text() else '')
+    @AddWatcher
+    def __fulltext_list_doubleclicked(self,item:QListWidgetItem)->None:
+        if (n:=item.data(Qt.ItemDataRole.UserRole)) in mainwindow.tools:
+            mainwindow.UseTool(n,True)
+            self.done(-1)
+    @AddWatcher
+    def __content_scroll_valuechanged(self,value:int)->None:
+        self.RecycleItems()
     @AddWatcher
     def __switch_search(self)->None:
-        n=self.boards.index(self.hidden_board.children()[0])
-        MoveControl(self.boards[n],self)
-        MoveControl(self.boards[1-n],self.hidden_board)
+        MoveControl(self.boards[self.mode],self.hidden_board)
+        self.mode=(self.mode+1)%3
+        MoveControl(self.boards[self.mode],self)
+        self.search_tools.setPlaceholderText('检索名称、描述和文档' if self.mode==2 else '检索名称和描述')
+        if self.mode==2:
+            appoptions.Rebuild()
+            self.__fulltext()
     @AddWatcher
     def __show_unmatched(self,event:Qt.CheckState)->None:
         mainwindow.searchkeywords[0]=self.show_unmatched.isChecked()
         self.__search()
     @AddWatcher
     def __search_process_keyrelease(self,event:QKeyEvent)->None:
-        if event.key() in [Qt.Key.Key_Enter,Qt.Key.Key_Return] and self.hidden_board.children()[0] is self.boards[0]:self.tools_browser.find_text.setFocus()
+        if event.key() in [Qt.Key.Key_Enter,Qt.Key.Key_Return] and self.mode==1:self.tools_browser.find_text.setFocus()
     @AddWatcher
     def __search_tools_textchanged(self,text:str)->None:
-        self.__search()
+        self.searchtimer.start()
     @AddWatcher
     def __js_method_called(self,argument:list)->None:
         mainwindow.UseTool(argument[1],argument[0])
@@ -1355,32 +2256,30 @@ class ToolItem(QFrame):
     @AddWatcher
     def __init__(self,parent:QGroupBox,name:str,panel:ToolsPanel|None=None)->None:
         super().__init__(parent)
-        t=mainwindow.tools[name]
-        self.matched=True
         self.name=name
         self.panel=panel
-        self.target=f'{t['name']}\n{t['note']}'.lower()
         self.resize(204,34)
         self.setStyleSheet('ToolItem:hover{background-color:gray}')
-        c=mainwindow.icons.get(t['prefix'] or t['icon']) if (t['path'],t['file'].lower()) in [('.','cmd.exe'),('.','powershell.exe')] or GetExistsFileName(f'{t['path']}/{t['file'].split(' ')[-1]}') else mainwindow.icons['stopped']
-        n=t['note'] or t['name']
-        if t['type']=='cmd':
-            c=c or mainwindow.icons['cmd']
-            CreateControl(QPushButton,self,2,2,170,30,t['name'].replace('&','&&'),self.__buttons,n,c)
-            CreateControl(QPushButton,self,172,2,30,30,'',self.__buttons,n,c)
-        else:CreateControl(QPushButton,self,2,2,200,30,t['name'].replace('&','&&'),self.__buttons,f'{f'{t['path']}\n' if t['type']=='url' else ''}{n}',GetUrlIcon(t['name']) if t['type']=='url' else (c or GetFileIcon(f'{t['path']}/{t['file']}')))
+        self.buttons=[CreateControl(QPushButton,self,2,2,170,30,click=self.__buttons),CreateControl(QPushButton,self,172,2,30,30,click=self.__buttons)]
         self.border_frame=CreateControl(QFrame,self,2,2,200,30)
         self.border_frame.hide()
         self.border_frame.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents,True)
         self.border_frame.setStyleSheet('border:2px solid red;')
+        self.RefreshConfig(mainwindow.tools[name])
         self.show()
     @AddWatcher
     def RefreshConfig(self,config:dict)->None:
-        n=config['name']
-        self.name=n
-        self.target=f'{n}\n{config['note']}'.lower()
-        self.children()[0].setText(n.replace('&','&&'))
-        for i in self.children()[:(config['type']=='cmd')+1]:ChangeIcon(i,GetUrlIcon(config['name']) if config['type']=='url' else mainwindow.icons.get(config['prefix'] or config['icon']) or (mainwindow.icons['cmd'] if config['type']=='cmd' else GetFileIcon(f'{config['path']}/{config['file']}'))).setToolTip(config['note'] or n)
+        t=config
+        c=mainwindow.icons.get(t['prefix'] or t['icon']) if (t['path'],t['file'].lower()) in [('.','cmd.exe'),('.','powershell.exe')] or GetExistsFileName(f'{t['path']}/{t['file'].split(' ')[-1]}') else mainwindow.icons['stopped']
+        n=t['note'] or t['name']
+        self.name=t['name']
+        self.buttons[0].setText(t['name'].replace('&','&&'))
+        self.buttons[0].resize(170 if t['type']=='cmd' else 200,30)
+        self.buttons[1].setVisible(t['type']=='cmd')
+        if t['type']=='cmd':
+            c=c or mainwindow.icons['cmd']
+            for i in self.buttons:ChangeIcon(i,c).setToolTip(n)
+        else:ChangeIcon(self.buttons[0],GetUrlIcon(t['name']) if t['type']=='url' else (c or GetFileIcon(f'{t['path']}/{t['file']}'))).setToolTip(f'{f'{t['path']}\n' if t['type']=='url' else ''}{n}')
     @AddWatcher
     def __buttons(self)->None:
         s=self.sender()
@@ -1838,9 +2737,7 @@ class ProcessDialog(QMainWindow):
     @AddWatcher
     def __init__(self)->None:
         super().__init__()
-        self.foldlist=[]
         self.model=ProcessTreeModel()
-        self.selected=0
         self.move(mainwindow.x()+1335,mainwindow.y())
         self.setAttribute(Qt.WidgetAttribute.WA_AlwaysShowToolTips,True)
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose,True)
@@ -1876,15 +2773,15 @@ class ProcessDialog(QMainWindow):
         self.process_tree.setStyleSheet('QTreeView::branch:closed:has-children{image:url(resources/icons/closed.png);}QTreeView::branch:open:has-children{image:url(resources/icons/opened.png);}')
         self.process_tree.contextMenuEvent=self.__process_tree_contextmenu
         self.process_tree.header().setDefaultAlignment(Qt.AlignmentFlag.AlignHCenter)
+        self.model.rowsInserted.connect(self.__rowsinserted)
         self.anchors=[[3,self.search_process],[8,self.process_tree]]
-        self.timer=self.startTimer(1000) if appconfig['process']['autorefresh'] else 0
-        self.__refreshtree()
+        self.RefreshTree()
         self.__refreshfilter()
     @AddWatcher
     def GetLevel(self,node:ProcessNode|None)->int:
         if node is None:return 0
         a=node.Layer()
-        return max(a-2,0) if any(i.topic.ppid==node.root.pid for i in mainwindow.tab_area.SortedTabs()[1:]) else (a>2 or a==2 and node.parent.children.index(node))+1
+        return max(a-2,0) if node.root.pid in mainwindow.tab_area.ppids else (a>2 or a==2 and node.Row())+1
     @AddWatcher
     def GetRoot(self,node:ProcessNode)->ProcessNode:
         return self.GetRoot(node.parent) if node.parent.parent and self.GetLevel(node.parent) else node
@@ -1892,6 +2789,11 @@ class ProcessDialog(QMainWindow):
     def GetSelectedNode(self)->ProcessNode|None:
         return self.process_tree.selectedIndexes()[0].internalPointer() if self.process_tree.selectedIndexes() else None
     @AddWatcher
+    def RefreshTree(self,snapshot:ProcessSnapshot|None=None)->None:
+        if self.model.RefreshTree(mainwindow.processlist,snapshot or mainwindow.snapshot):
+            self.process_tree.resizeColumnToContents(0)
+            self.process_tree.resizeColumnToContents(1)
+    @AddWatcher
     def __shortcutf5(self)->None:
         if (n:=self.__getfile(self.GetSelectedNode())):SelectFile(n)
     @AddWatcher
@@ -1916,42 +2818,18 @@ class ProcessDialog(QMainWindow):
                 RequestMessage('w',self,'警告',f'窗口“{n.name}”捕捉失败。<br><span style="color:red">该进程窗口可能已被破坏，无法利用，已从进程列表移除。<br>请勿尝试结束进程，在较高版本 Windows 11 上会引发蓝屏重启！</span>')
         except:RequestMessage('w',self,'警告',f'没有找到窗口“{n.name}”，无法捕捉')
     @AddWatcher
-    def __getfold(self,index:QModelIndex)->None:
-        if index.isValid() and not self.process_tree.isExpanded(index):self.foldlist.append(index.internalPointer().pid)
-        for i in range(self.model.rowCount(index)):self.__getfold(self.model.index(i,0,index))
-    @AddWatcher
     def __refreshfilter(self)->None:
         self.model.filter=self.search_process.text().lower()
         self.process_tree.viewport().update()
     @AddWatcher
-    def __refreshtree(self)->None:
-        n=self.GetSelectedNode()
-        self.selected=n.pid if n else 0
-        self.foldlist.clear()
-        self.__getfold(QModelIndex())
-        self.process_tree.clearSelection()
-        # p=[['',4]]
-        # for i in psutil.process_iter(['pid','ppid']):
-        #     try:
-        #         if i.pid and not psutil.pid_exists(i.ppid()):p.append(['',i.pid])
-        #     except:pass
-        self.model.RefreshTree(mainwindow.processlist)
-        self.process_tree.expandAll()
-        self.__setfold(QModelIndex())
-        self.process_tree.resizeColumnToContents(0)
-        self.process_tree.resizeColumnToContents(1)
-    @AddWatcher
-    def __setfold(self,index:QModelIndex)->None:
-        if self.selected and index.isValid() and index.internalPointer().pid==self.selected:
-            self.process_tree.selectionModel().select(QItemSelection(index,index.sibling(index.row(),2)),QItemSelectionModel.SelectionFlag.Select)
-            self.selected=0
-        if index.isValid() and index.internalPointer().pid in self.foldlist:self.process_tree.setExpanded(index,False)
-        for i in range(self.model.rowCount(index)):self.__setfold(self.model.index(i,0,index))
+    def __rowsinserted(self,parent:QModelIndex,first:int,last:int)->None:
+        if parent.isValid() and parent.internalPointer().lifecycle==7:self.process_tree.expand(parent)
     @AddWatcher
     def __getfile(self,node:ProcessNode|None)->str:
         if node is None:return ''
+        if node.details is None:node.details=appprocesscache.Get(node.process)
         t=mainwindow.tools[node.root.name.removeprefix('[内嵌] ').removeprefix('[待捕捉] ')]
-        if node.Layer()>2 or node.Layer()==2 and node.parent.children.index(node):
+        if (a:=node.Layer())>2 or a==2 and node.Row():
             c=[i.lower() for i in node.cmdline if i]
             match node.file.lower():
                 case 'conhost.exe':return self.__getfile(node.parent)
@@ -1968,15 +2846,13 @@ class ProcessDialog(QMainWindow):
     def __terminate(self,pid:int,whole:bool)->None:
         if RequestMessage('w',self,'警告',f'是否结束指定进程{'所在的整个进程树？' if whole else '及所有子进程？<br><span style="color:red">无特殊理由，推荐结束整个进程树，以避免各种潜在问题</span>'}',QMessageBox.StandardButton.Yes|QMessageBox.StandardButton.No,QMessageBox.StandardButton.No)==QMessageBox.StandardButton.Yes:
             RequestMessage('w',self,'警告',f'进程树结束{'成功' if Terminate(pid) or not psutil.pid_exists(pid) else '失败'}')
-            self.__refreshtree()
+            self.RefreshTree(ProcessSnapshot())
     @AddWatcher
     def __refresh_processes(self)->None:
-        self.__refreshtree()
+        self.RefreshTree(ProcessSnapshot())
         self.process_tree.viewport().update()
     @AddWatcher
     def __auto_refresh(self,event:Qt.CheckState)->None:
-        if self.auto_refresh.isChecked():self.timer=self.startTimer(1000)
-        else:self.killTimer(self.timer)
         appconfig['process']['autorefresh']=self.auto_refresh.isChecked()
         mainwindow.SaveConfig()
     @AddWatcher
@@ -2014,10 +2890,6 @@ class ProcessDialog(QMainWindow):
     def resizeEvent(self,event:QResizeEvent)->None:
         Reshape(self,event)
         return super().resizeEvent(event)
-    @AddWatcher
-    def timerEvent(self,event:QTimerEvent)->None:
-        self.__refreshtree()
-        return super().timerEvent(event)
 
 class ConfigDialog(QDialog):
     @AddWatcher
@@ -2095,20 +2967,29 @@ class EmbedCmdTopic(TopicBase):
     def __init__(self,name:str,ppid:int=0,cpid:int=0,hwnd:int=0)->None:
         super().__init__(name)
         t=mainwindow.tools[name]
+        self.capture=[None,None,(0,0)]
         self.config=t
         self.cpid=cpid
         self.executors=[]
         self.hwnd=hwnd
+        self.lookup=0
         self.model=QStandardItemModel()
         self.outputpath=f'{apppath}/{t['path']}/{t['output']}'.rstrip('/')
+        self.outputs=[]
+        self.pattern=GetOutputPattern(t['format'])
         self.ppid=ppid
         self.watcher=QFileSystemWatcher([self.outputpath])
         self.watcher.directoryChanged.connect(self.__watcherupdate)
+        self.watchtimer=QTimer(self)
+        self.watchtimer.setInterval(200)
+        self.watchtimer.setSingleShot(True)
+        self.watchtimer.timeout.connect(self.__refreshoutputs)
         self.setAcceptDrops(True)
         self.mask_canvas=CreateControl(QFrame,self,0,0,1000,500)
         self.switch_help=CreateControl(QPushButton,self,10,10,85,30,'查看文档(&V)',self.__switch_help)
         self.command_text=CreateControl(QLineEdit,self,105,10,560,30,f'{GetPrefix(t['prefix'])} {t['file']}'.strip())
         self.command_text.keyReleaseEvent=self.__command_text
+        self.completer=OptionCompleter(self.command_text,lambda:self.config['name'])
         self.command_button=CreateControl(QPushButton,self,675,10,85,30,'执行命令(&E)',self.__command_button)
         self.pause_resume=CreateControl(QPushButton,self,770,10,30,30,click=self.__pause_resume)
         self.report_folder=CreateControl(QPushButton,self,810,10,85,30,'配置输出(&F)',self.__report_folder)
@@ -2117,23 +2998,27 @@ class EmbedCmdTopic(TopicBase):
         self.command_area.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.reboot_command=CreateControl(QPushButton,self.command_area,0,0,100,30,'重启命令行进程',self.__reboot_command)
         self.reboot_command.hide()
-        self.help_browser=WebArea(self,30,70,750,290,f'{mainwindow.htmlhead}{ReadFile(f'resources/docs/{t['name']}.html') or '<h2>没有帮助文档</h2>'}<script>{mainwindow.htmlroot}{mainwindow.htmltail}</script>',self.__js_method_called,lambda:self.command_text.setFocus())
-        self.help_browser.hide()
+        self.help_browser=None
         self.output_list=CreateControl(QListView,self,810,50,180,440)
         self.output_list.setModel(self.model)
         self.output_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.output_list.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.output_list.doubleClicked.connect(self.__output_list_doubleclicked)
         self.output_list.contextMenuEvent=self.__output_list_contextmenu
-        self.anchors=[[3,self.command_button,self.pause_resume,self.report_folder,self.open_path],[5,self.output_list],[6,self.command_text],[8,self.mask_canvas,self.command_area,self.help_browser]]
-        self.__watcherupdate('')
+        self.anchors=[[3,self.command_button,self.pause_resume,self.report_folder,self.open_path],[5,self.output_list],[6,self.command_text],[8,self.mask_canvas,self.command_area]]
+        self.__refreshoutputs()
         QTimer.singleShot(100,self.__createwindow)
     @AddWatcher
     def CleanUp(self,cleancode:int)->bool:
-        if cleancode==1 and self.GetProcessList():return RequestMessage('w',mainwindow,'警告','请先结束正在执行的任务') and False
+        if cleancode==1 and self.GetProcessList(ProcessSnapshot()):return RequestMessage('w',mainwindow,'警告','请先结束正在执行的任务') and False
         else:
-            CloseControl(self.help_browser)
+            appwebpool.Release(self.help_browser)
+            self.help_browser=None
+            self.__releasecapture()
+            if self.lookup and (p:=mainwindow.CancelDiscovery(self.lookup)):Terminate(p)
+            self.lookup=0
             if self.hwnd:
+                mainwindow.dispatcher.Cancel(self.hwnd)
                 if cleancode==4 or cleancode==2 and self.GetProcessList():
                     win32gui.SetParent(self.hwnd,0)
                     win32gui.SetWindowLong(self.hwnd,win32con.GWL_STYLE,self.windowvalues[0])
@@ -2149,46 +3034,52 @@ class EmbedCmdTopic(TopicBase):
             mainwindow.SaveConfig()
             return True
     @AddWatcher
-    def GetProcessList(self)->list[psutil.Process]|None:
-        try:return [i for i in psutil.Process(self.ppid).children(recursive=True) if i.name().lower() not in ['cmd.exe','powershell.exe'] and i.status() in [psutil.STATUS_RUNNING,psutil.STATUS_STOPPED]]
-        except:
-            self.hwnd=0
-            return None
+    def GetProcessList(self,snapshot:ProcessSnapshot|None=None)->list[psutil.Process]|None:
+        if self.ppid and self.ppid in (s:=snapshot or mainwindow.snapshot).processes:return [i for i in s.Descendants(self.ppid) if (i.info['name'] or '').lower() not in ['cmd.exe','powershell.exe'] and i.info['status'] in [psutil.STATUS_RUNNING,psutil.STATUS_STOPPED]]
+        if self.ppid and psutil.pid_exists(self.ppid):return []
+        self.hwnd=0
+        return None
     @AddWatcher
     def GrabCommand(self)->list[str]:
-        return [f'进程：{p[0].exe().split('\\')[-1]}',f'参数：{' '.join(p[0].cmdline()[1:])}'] if (p:=self.GetProcessList()) else ['进程：未运行','参数：无']
+        return [f'进程：{(d['exe'] or p[0].info['name'] or '').split('\\')[-1]}',f'参数：{' '.join((d['cmdline'] or [])[1:])}'] if (p:=self.GetProcessList()) and (d:=appprocesscache.Get(p[0])) else ['进程：未运行','参数：无']
     @AddWatcher
-    def GrabWindow(self)->QPixmap:
-        if self.hwnd:
-            r=win32gui.GetWindowRect(self.hwnd)
+    def GrabWindow(self,width:int=0)->QImage:
+        if self.hwnd and (r:=win32gui.GetWindowRect(self.hwnd))[2]>r[0] and r[3]>r[1]:
             w,h=r[2]-r[0],r[3]-r[1]
+            a,b=ScaledSize(w,h,width)
             d=win32gui.GetWindowDC(self.hwnd)
             p=win32ui.CreateDCFromHandle(d)
-            q=p.CreateCompatibleDC()
-            b=win32ui.CreateBitmap()
-            b.CreateCompatibleBitmap(p,w,h)
-            q.SelectObject(b)
-            q.BitBlt((0,0),(w,h),p,(0,0),win32con.SRCCOPY)
-            m=b.GetInfo()
-            n=QImage(b.GetBitmapBits(True),m['bmWidth'],m['bmHeight'],QImage.Format.Format_RGB32)
-            win32gui.DeleteObject(b.GetHandle())
-            q.DeleteDC()
+            if self.capture[2]!=(a,b):
+                self.__releasecapture()
+                q=p.CreateCompatibleDC()
+                m=win32ui.CreateBitmap()
+                m.CreateCompatibleBitmap(p,a,b)
+                q.SelectObject(m)
+                win32gui.SetStretchBltMode(q.GetSafeHdc(),win32con.HALFTONE)
+                ctypes.windll.gdi32.SetBrushOrgEx(q.GetSafeHdc(),0,0,None)
+                self.capture=[q,m,(a,b)]
+            q,m=self.capture[:2]
+            if (a,b)==(w,h):q.BitBlt((0,0),(w,h),p,(0,0),win32con.SRCCOPY)
+            else:q.StretchBlt((0,0),(a,b),p,(0,0),(w,h),win32con.SRCCOPY)
+            n=QImage(m.GetBitmapBits(True),a,b,QImage.Format.Format_RGB32).copy()
             p.DeleteDC()
             win32gui.ReleaseDC(self.hwnd,d)
-            return QPixmap(n.copy())
+            return n
         else:
-            c=QPixmap(self.command_area.size())
+            c=QImage(self.command_area.size(),QImage.Format.Format_RGB32)
             c.fill(Qt.GlobalColor.black)
             return c
     @AddWatcher
     def __createwindow(self)->None:
         if self.hwnd:self.__windowfounded(self.ppid,self.cpid,self.hwnd)
-        else:
-            self.founder=WindowFounder(self.config['path'])
-            self.founder.signaler.connect(self.__windowfounded)
-            self.founder.start()
+        elif not self.lookup:self.lookup=mainwindow.DiscoverWindow(subprocess.Popen(f'conhost cmd /k "cd /d {self.config['path']}"',creationflags=subprocess.CREATE_NEW_CONSOLE).pid,self.__windowfounded)
     @AddWatcher
     def __windowfounded(self,ppid:int,cpid:int,hwnd:int)->None:
+        self.lookup=0
+        if not hwnd:
+            if ppid:Terminate(ppid)
+            self.reboot_command.show()
+            return self.__resizewindow()
         self.windowvalues=[win32gui.GetWindowLong(hwnd,win32con.GWL_STYLE),win32gui.GetWindowLong(hwnd,win32con.GWL_EXSTYLE),win32gui.GetWindowPlacement(hwnd)]
         # win32gui.SetWindowLong(h,win32con.GWL_STYLE,win32gui.GetWindowLong(h,win32con.GWL_STYLE)&~0x00800000&~0x00010000)
         # win32gui.SetWindowLong(h,win32con.GWL_STYLE,win32gui.GetWindowLong(h,win32con.GWL_STYLE)&~(win32con.WS_CAPTION|win32con.WS_THICKFRAME)|win32con.WS_CHILD)
@@ -2202,14 +3093,35 @@ class EmbedCmdTopic(TopicBase):
         self.cpid=cpid
         self.hwnd=hwnd
         self.ppid=ppid
+        mainwindow.tab_area.Reindex()
         self.reboot_command.show()
         self.__resizewindow()
         self.resize(self.size()-QSize(0,1))
         self.resize(self.size()+QSize(0,1))
     @AddWatcher
+    def __releasecapture(self)->None:
+        if self.capture[0]:
+            win32gui.DeleteObject(self.capture[1].GetHandle())
+            self.capture[0].DeleteDC()
+        self.capture=[None,None,(0,0)]
+    @AddWatcher
     def __watcherupdate(self,path:str)->None:
-        self.model.clear()
-        for i in sorted((i for j in (self.config['format'] or '*.txt').split(',') for i in pathlib.Path(self.outputpath).glob(j)),key=lambda i:i.name):self.model.appendRow(QStandardItem(GetFileIcon(i),i.name))
+        if not self.watchtimer.isActive():self.watchtimer.start()
+    @AddWatcher
+    def __refreshoutputs(self)->None:
+        try:
+            with os.scandir(self.outputpath) as d:n=sorted(i.name for i in d if self.pattern.match(i.name))
+        except OSError:n=[]
+        s=set(n)
+        for r in range(len(self.outputs)-1,-1,-1):
+            if self.outputs[r] not in s:
+                self.outputs.pop(r)
+                self.model.removeRow(r)
+        s=set(self.outputs)
+        for i in (i for i in n if i not in s):
+            r=bisect.bisect(self.outputs,i)
+            self.outputs.insert(r,i)
+            self.model.insertRow(r,QStandardItem(GetFileIcon(f'{self.outputpath}/{i}'),i))
     @AddWatcher
     def __resizewindow(self)->None:
         r=QGuiApplication.primaryScreen().devicePixelRatio()
@@ -2217,20 +3129,27 @@ class EmbedCmdTopic(TopicBase):
         if self.hwnd:win32gui.MoveWindow(self.hwnd,0,0,int(self.command_area.width()*r),int(self.command_area.height()*r),True)
     @AddWatcher
     def __switch_help(self)->None:
-        if self.help_browser.isVisible():
-            self.help_browser.hide()
+        if self.help_browser:
+            appwebpool.Release(self.help_browser)
+            self.help_browser=None
             self.command_text.setFocus()
-        else:self.help_browser.show()
+        else:
+            n=f'resources/docs/{self.config['name']}.html'
+            self.help_browser=appwebpool.Acquire(f'toolbox:/docs/{urllib.parse.quote(self.config['name'])}.html?{int(TryGet(os.path.getmtime,None,n) or 0)}',self,30,70,self.command_area.width()-40,self.command_area.height()-150,self.__js_method_called,lambda:self.command_text.setFocus())
+            self.help_browser.show()
+            self.help_browser.raise_()
     @AddWatcher
     def __command_text(self,event:QKeyEvent)->None:
-        if event.key()==Qt.Key.Key_Escape and self.help_browser.isVisible():self.help_browser.hide()
-        elif event.key() in [Qt.Key.Key_Enter,Qt.Key.Key_Return]:self.__command_button()
+        if event.key()==Qt.Key.Key_Escape and self.help_browser:self.__switch_help()
+        elif event.key() in [Qt.Key.Key_Enter,Qt.Key.Key_Return]:
+            if self.completer.completed:self.completer.completed=False
+            else:self.__command_button()
     @AddWatcher
     def __command_button(self)->None:
-        if self.hwnd and self.command_text.text():
-            for i in f'{self.command_text.text()}\r':
-                win32gui.PostMessage(self.hwnd,win32con.WM_CHAR,ord(i),0)
-                time.sleep(0.01)
+        if self.hwnd and self.command_text.text():mainwindow.SendCommand(self.hwnd,f'{self.command_text.text()}\r',self.__commandsent)
+    @AddWatcher
+    def __commandsent(self,state:str)->None:
+        if state=='failed':RequestMessage('w',mainwindow,'警告','命令发送失败，控制台窗口未响应')
     @AddWatcher
     def __pause_resume(self)->None:
         if (p:=self.GetProcessList()):
@@ -2251,9 +3170,12 @@ class EmbedCmdTopic(TopicBase):
                 self.config['output']=m[0]
                 self.outputpath=f'{apppath}/{self.config['path']}/{self.config['output']}'.rstrip('/')
                 self.config['format']=m[1]
+                self.outputs.clear()
+                self.model.clear()
+                self.pattern=GetOutputPattern(m[1])
                 self.watcher.removePaths(self.watcher.directories())
                 self.watcher.addPath(self.outputpath)
-                self.__watcherupdate('')
+                self.__refreshoutputs()
                 mainwindow.SaveTools(2,self.config|{'oldname':self.config['name']})
     @AddWatcher
     def __open_path(self)->None:
@@ -2299,19 +3221,33 @@ class EmbedCmdTopic(TopicBase):
     @AddWatcher
     def resizeEvent(self,event:QResizeEvent)->None:
         Reshape(self,event)
+        if self.help_browser:self.help_browser.resize(self.command_area.width()-40,self.command_area.height()-150)
         self.__resizewindow()
         return super().resizeEvent(event)
 
 QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+appscheme=QWebEngineUrlScheme(b'toolbox')
+appscheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme|QWebEngineUrlScheme.Flag.LocalScheme|QWebEngineUrlScheme.Flag.LocalAccessAllowed|QWebEngineUrlScheme.Flag.CorsEnabled)
+appscheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+QWebEngineUrlScheme.registerScheme(appscheme)
 app=QApplication(sys.argv)
 app.setFont(QFont('SimHei',9))
 app.setStartDragDistance(100)
 app.setStyle('Fusion')
 app.setStyleSheet('QDialog{font-family:"SimHei";}')
+appanimations=AnimationScheduler(300,50)
+appassets=AssetSchemeHandler(256)
 appconfig={}
+appdatabase=DatabasePool('resources/data.db')
+appfulltext=FullTextIndex()
+appiconcache=IconCache(512)
+appiconfiles=IconFileCache('resources/iconcache')
 appiconprovider=QFileIconProvider()
+appoptions=OptionIndex('resources/docs')
 apppath=str(pathlib.Path.cwd()).replace('\\','/')
+appprocesscache=ProcessCache(4096)
 appuser=psutil.Process(os.getpid()).username()
+appwebpool=WebPagePool()
 mainwindow=MainWindow()
 app.installEventFilter(mainwindow)
 